@@ -12,6 +12,8 @@ This exercise demonstrates:
 2. Handling mathematical rules with boolean logic
 3. Different approaches to solving the same logical problem
 4. Efficient expression of complex conditional logic
+5. Counting leap years over a range with a closed-form formula instead of a loop
+6. Precomputing a table for the 400-year cycle the calendar repeats on
 
 My Learning Process:
 I initially approached this by thinking through the problem step by step, talking through 
@@ -20,6 +22,9 @@ of the leap year rules. I explored different ways to structure the boolean expre
 settling on a concise solution using boolean chaining.
 """
 
+from itertools import accumulate
+
+
 def leap_year(year: int) -> bool:
     """
     Determine whether a given year is a leap year according to Gregorian calendar rules.
@@ -47,4 +52,123 @@ def leap_year(year: int) -> bool:
         The 'not' operator before modulo expressions is an alternative to '== 0' comparisons
         that I learned about but didn't initially use in my solution.
     """
-    return (year % 100 == 0 and year % 400 == 0) or (year % 4 == 0 and year % 100 != 0)
\ No newline at end of file
+    return (year % 100 == 0 and year % 400 == 0) or (year % 4 == 0 and year % 100 != 0)
+
+
+# Calendar tables for the functions below. They're built with leap_year(), so
+# they have to come after it, and they're computed once when the module loads.
+CYCLE_YEARS = 400
+CYCLE_DAYS = 146097  # 400 * 365 plus the 97 leap days in every 400 years
+YEAR_ZERO_DAYS = 366  # Year 0 is a leap year, so 0001-01-01 is 366 days after 0000-01-01
+
+MONTH_DAYS = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+# Days before the first of each month: row 0 for common years, row 1 for leap years
+DAYS_BEFORE_MONTH = (
+    tuple(accumulate(MONTH_DAYS, initial=0)),
+    tuple(accumulate((29 if month == 1 else days for month, days in enumerate(MONTH_DAYS)), initial=0)),
+)
+
+# Days from the start of a 400-year cycle to the start of each year in it (401 entries)
+DAYS_BEFORE_CYCLE_YEAR = tuple(accumulate((366 if leap_year(year) else 365 for year in range(CYCLE_YEARS)),
+                                          initial=0))
+
+
+def count_leap_years(start: int, end: int) -> int:
+    """
+    Count the leap years in range(start, end) without looping over them.
+    
+    Args:
+        start: int - first year to include
+        end: int - first year past the range
+        
+    Returns:
+        int - how many of those years leap_year() accepts (0 if end <= start)
+        
+    Notes:
+        The number of multiples of n in [start, end) is (end - 1) // n - (start - 1) // n.
+        Count the multiples of 4, take away the multiples of 100 and add back the
+        multiples of 400. Python's // rounds down, so this works unchanged for
+        year 0 and negative years.
+    
+    Examples:
+        >>> count_leap_years(1900, 2001)
+        25
+        >>> count_leap_years(-400, 1)
+        98
+    """
+    if end <= start:
+        return 0
+    return sum(sign * ((end - 1) // step - (start - 1) // step) for step, sign in ((4, 1), (100, -1), (400, 1)))
+
+
+def days_in_month(year: int, month: int) -> int:
+    """
+    Number of days in a month, using leap_year() for February.
+    
+    Examples:
+        >>> days_in_month(2000, 2), days_in_month(1900, 2)
+        (29, 28)
+    """
+    if not 1 <= month <= 12:
+        raise ValueError('month must be between 1 and 12')
+    return MONTH_DAYS[month - 1] + (month == 2 and leap_year(year))
+
+
+def day_of_year(year: int, month: int, day: int) -> int:
+    """
+    Position of a date within its year, starting from 1 for January 1st.
+    
+    Raises:
+        ValueError: if the month or day doesn't exist
+    
+    Examples:
+        >>> day_of_year(2024, 3, 1), day_of_year(2023, 3, 1)
+        (61, 60)
+    """
+    if not 1 <= day <= days_in_month(year, month):
+        raise ValueError('day is out of range for month')
+    return DAYS_BEFORE_MONTH[leap_year(year)][month - 1] + day
+
+
+def day_number(year: int, month: int, day: int) -> int:
+    """
+    Serial day number of a date in the proleptic Gregorian calendar.
+    
+    Args:
+        year: int - any year, including 0 and negative years
+        month: int - 1 to 12
+        day: int - day of the month
+        
+    Returns:
+        int - 1 for 0001-01-01, the same numbering as datetime.date.toordinal();
+        earlier dates get 0 and negative numbers
+        
+    Purpose:
+        The calendar repeats exactly every 400 years, so whole cycles are
+        multiplied out and the rest is one lookup in DAYS_BEFORE_CYCLE_YEAR.
+        That makes the cost the same for any year.
+    
+    Examples:
+        >>> day_number(1, 1, 1), day_number(2024, 2, 29)
+        (1, 738945)
+        >>> day_number(0, 12, 31)
+        0
+    """
+    cycles, year_in_cycle = divmod(year, CYCLE_YEARS)
+    days = cycles * CYCLE_DAYS + DAYS_BEFORE_CYCLE_YEAR[year_in_cycle] + day_of_year(year, month, day) - 1
+    return days - YEAR_ZERO_DAYS + 1
+
+
+def days_between(start: tuple, end: tuple) -> int:
+    """
+    Number of days from one (year, month, day) date to another.
+    
+    Returns:
+        int - negative if end comes before start
+    
+    Examples:
+        >>> days_between((2000, 1, 1), (2100, 1, 1))
+        36525
+    """
+    return day_number(*end) - day_number(*start)
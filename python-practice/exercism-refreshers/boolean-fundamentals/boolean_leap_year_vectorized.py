@@ -0,0 +1,40 @@
+"""
+Vectorized Leap Year Check
+
+Context:
+Date-heavy ETL jobs call leap_year() once per row, which means one Python call
+for every date in the table. This module applies the same divisibility rules to
+a whole NumPy array of years in a few element-wise operations.
+
+This exercise demonstrates:
+1. Rewriting a boolean expression with & and | so it works on arrays
+2. Relying on NumPy's % rounding the same way as Python's for negative years
+
+Requires NumPy. count_leap_years, day_of_year and days_between live in
+boolean_leap_year and need no NumPy.
+"""
+
+import numpy as np
+
+
+def leap_years(years) -> np.ndarray:
+    """
+    Check a whole array of years against the Gregorian leap year rules.
+    
+    Args:
+        years: array-like of int - the years to check
+        
+    Returns:
+        np.ndarray - a boolean array, True where leap_year() would return True
+        
+    Notes:
+        For integers, NumPy's % takes the sign of the divisor just like
+        Python's, so -4 % 4 is 0 and year 0 and negative years match
+        leap_year() exactly.
+    
+    Examples:
+        >>> leap_years([1900, 2000, 2023, 2024, 0, -4, -100]).tolist()
+        [False, True, False, True, True, True, False]
+    """
+    years = np.asarray(years, dtype=np.int64)
+    return (years % 4 == 0) & ((years % 100 != 0) | (years % 400 == 0))
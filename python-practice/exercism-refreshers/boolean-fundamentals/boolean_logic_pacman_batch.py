@@ -0,0 +1,112 @@
+"""
+Pac-Man Rules for Many Sessions at Once
+
+Context:
+eat_ghost, score, lose and win take one game's booleans at a time. A game
+server running around 100,000 sessions would have to call each of them 100,000
+times per tick. Instead, each flag can be stored as a bitset where bit n is
+that flag for session n. The same rules then become a handful of bitwise
+operations that answer the question for every session in one go.
+
+This exercise demonstrates:
+1. Replacing and/or/not with the bitwise operators &, | and ~
+2. Packing many booleans into the bits of a single integer
+3. Writing functions that work the same on ints and NumPy arrays
+4. Checking a batch version against the original for every input combination
+
+The functions accept any of these, as long as all arguments use the same kind:
+- Python ints used as bitsets (no size limit, no dependencies)
+- NumPy bool arrays, one entry per session
+- NumPy uint8 arrays from np.packbits, eight sessions per byte
+
+Notes:
+`not x` can't be used on a bitset because it asks whether the whole value is
+zero. `~x` flips every bit instead, but on a Python int it also turns the
+number negative (~0 is -1, an endless run of 1 bits). That's harmless here
+because every ~ is ANDed with a flag that is already zero past the last
+session, so the extra bits always drop away.
+
+Examples:
+    Eight sessions cover every combination of three flags, so one call per
+    rule checks it against the original function for every possible input:
+
+    >>> from itertools import product
+    >>> from boolean_logic_pacman_problem import eat_ghost, lose, score, win
+    >>> combinations = list(product([False, True], repeat=3))
+    >>> first, second, third = (pack_sessions(flags[index] for flags in combinations) for index in range(3))
+    >>> unpack_sessions(eat_ghost_many(first, second), 8) == [eat_ghost(a, b) for a, b, _ in combinations]
+    True
+    >>> unpack_sessions(score_many(first, second), 8) == [score(a, b) for a, b, _ in combinations]
+    True
+    >>> unpack_sessions(lose_many(first, second), 8) == [lose(a, b) for a, b, _ in combinations]
+    True
+    >>> unpack_sessions(win_many(first, second, third), 8) == [win(a, b, c) for a, b, c in combinations]
+    True
+"""
+
+
+def eat_ghost_many(power_pellet_active, touching_ghost):
+    """
+    Sessions where Pac-Man eats a ghost this tick.
+    
+    Examples:
+        >>> bin(eat_ghost_many(0b1100, 0b1010))
+        '0b1000'
+    """
+    return power_pellet_active & touching_ghost
+
+
+def score_many(touching_power_pellet, touching_dot):
+    """
+    Sessions where Pac-Man scores points this tick.
+    
+    Examples:
+        >>> bin(score_many(0b1100, 0b1010))
+        '0b1110'
+    """
+    return touching_power_pellet | touching_dot
+
+
+def lose_many(power_pellet_active, touching_ghost):
+    """
+    Sessions that are lost this tick: touching a ghost without a power pellet.
+    
+    Examples:
+        >>> bin(lose_many(0b1100, 0b1010))
+        '0b10'
+    """
+    return touching_ghost & ~power_pellet_active
+
+
+def win_many(has_eaten_all_dots, power_pellet_active, touching_ghost):
+    """
+    Sessions that are won this tick: all dots eaten and not lost.
+    
+    Examples:
+        >>> bin(win_many(0b1111, 0b1100, 0b1010))
+        '0b1101'
+    """
+    return has_eaten_all_dots & ~lose_many(power_pellet_active, touching_ghost)
+
+
+def pack_sessions(flags) -> int:
+    """
+    Pack one boolean per session into an int bitset (session n becomes bit n).
+    
+    Examples:
+        >>> bin(pack_sessions([True, False, True]))
+        '0b101'
+    """
+    return int(''.join('1' if flag else '0' for flag in reversed(list(flags))) or '0', 2)
+
+
+def unpack_sessions(bitset: int, sessions: int) -> list:
+    """
+    Turn an int bitset back into one boolean per session.
+    
+    Examples:
+        >>> unpack_sessions(0b101, 4)
+        [True, False, True, False]
+    """
+    bits = format(bitset, 'b').zfill(sessions)[::-1]
+    return [bit == '1' for bit in bits[:sessions]]
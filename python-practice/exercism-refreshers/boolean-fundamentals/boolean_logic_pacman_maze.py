@@ -0,0 +1,195 @@
+"""
+Bitboard Pac-Man Maze
+
+Context:
+eat_ghost, score, lose and win assume the game already knows whether Pac-Man
+is touching a ghost, a dot or a power pellet. Working that out by scanning
+lists of entities every frame is where the time actually goes. This maze keeps
+the walls, dots and power pellets as bitboards (integers where each bit is one
+cell) and keeps the ghosts in a spatial hash keyed by cell. Every touch flag is
+then a single bit test or dictionary lookup, and the flags go straight into the
+four rule functions.
+
+This exercise demonstrates:
+1. Storing a grid as bitboards and testing cells with & and shifts
+2. Clearing a bit with &= ~bit when a dot is eaten
+3. Counting set bits (popcount) with int.bit_count()
+4. A spatial hash (dict of cell -> ghosts) for constant-time collision checks
+5. Feeding the computed flags into the existing rule functions
+
+Layout format:
+One string per row, using '#' for a wall, '.' for a dot, 'o' for a power
+pellet, 'P' for Pac-Man's start and 'G' for a ghost's start. Anything else is
+an empty corridor.
+
+Notes:
+Each row gets its own bitboard rather than one huge integer for the whole maze.
+Python ints are arbitrary precision, so testing or clearing one bit in a
+single big board costs time proportional to the size of the maze; a row is only
+as wide as the maze, so a frame costs the same no matter how many rows there are.
+The dots are counted once with popcount when the maze is built, and the count
+is lowered each time a dot is eaten, so has_eaten_all_dots never rescans the board.
+"""
+
+from typing import NamedTuple
+
+from boolean_logic_pacman_problem import eat_ghost, lose, score, win
+
+DIRECTIONS = {'up': (-1, 0), 'down': (1, 0), 'left': (0, -1), 'right': (0, 1)}
+POWER_PELLET_FRAMES = 40
+
+
+class Frame(NamedTuple):
+    """The touch flags for one frame and what the rule functions made of them."""
+    touching_ghost: bool
+    touching_dot: bool
+    touching_power_pellet: bool
+    power_pellet_active: bool
+    has_eaten_all_dots: bool
+    ate_ghost: bool
+    scored: bool
+    lost: bool
+    won: bool
+
+
+def _row_bitboard(row: str, symbols: str) -> int:
+    """Bitboard for one row with a bit set wherever the row has one of the symbols."""
+    board = 0
+    for column, symbol in enumerate(row):
+        if symbol in symbols:
+            board |= 1 << column
+    return board
+
+
+class Maze:
+    """
+    Walls, dots, power pellets and ghosts for one game, stored for fast lookups.
+    
+    Examples:
+        >>> maze = Maze(['#######',
+        ...              '#P.oG.#',
+        ...              '#######'])
+        >>> maze.dots_left
+        2
+        >>> maze.move_pacman('right'), maze.frame().scored
+        (True, True)
+        >>> maze.move_pacman('right'), maze.frame().power_pellet_active
+        (True, True)
+        >>> maze.move_pacman('right'), maze.frame().ate_ghost
+        (True, True)
+        >>> maze.move_pacman('right'), maze.frame().won
+        (True, True)
+        >>> maze.move_pacman('right')
+        False
+    """
+    __slots__ = ('width', 'height', 'walls', 'dots', 'pellets', 'dots_left', 'pacman',
+                 'ghosts', 'ghost_starts', 'ghost_cells', 'power_frames', 'power_duration')
+    
+    def __init__(self, layout, power_duration: int = POWER_PELLET_FRAMES):
+        rows = list(layout)
+        self.height = len(rows)
+        self.width = max((len(row) for row in rows), default=0)
+        self.walls = [_row_bitboard(row, '#') for row in rows]
+        self.dots = [_row_bitboard(row, '.') for row in rows]
+        self.pellets = [_row_bitboard(row, 'o') for row in rows]
+        self.dots_left = sum(board.bit_count() for board in self.dots)
+    
+        starts = [(row, column) for row, line in enumerate(rows) for column, symbol in enumerate(line) if symbol == 'P']
+        if len(starts) != 1:
+            raise ValueError(f'layout must have exactly one Pac-Man start, found {len(starts)}')
+        self.pacman = starts[0]
+    
+        self.ghost_starts = [(row, column) for row, line in enumerate(rows)
+                             for column, symbol in enumerate(line) if symbol == 'G']
+        self.ghosts = list(self.ghost_starts)
+        self.ghost_cells = {}
+        for ghost, cell in enumerate(self.ghosts):
+            self.ghost_cells.setdefault(cell, set()).add(ghost)
+    
+        self.power_frames = 0
+        self.power_duration = power_duration
+    
+    def is_wall(self, row: int, column: int) -> bool:
+        """Cells outside the maze count as walls."""
+        if not (0 <= row < self.height and 0 <= column < self.width):
+            return True
+        return bool(self.walls[row] >> column & 1)
+    
+    def move_pacman(self, direction: str) -> bool:
+        """
+        Move Pac-Man one cell, unless a wall is in the way.
+    
+        Returns:
+            bool - did Pac-Man move?
+        """
+        row_step, column_step = DIRECTIONS[direction]
+        row, column = self.pacman[0] + row_step, self.pacman[1] + column_step
+        if self.is_wall(row, column):
+            return False
+        self.pacman = (row, column)
+        return True
+    
+    def move_ghost(self, ghost: int, row: int, column: int):
+        """Put a ghost on a new cell, keeping the spatial hash up to date."""
+        old_cell = self.ghosts[ghost]
+        occupants = self.ghost_cells[old_cell]
+        occupants.discard(ghost)
+        if not occupants:
+            del self.ghost_cells[old_cell]
+        self.ghosts[ghost] = (row, column)
+        self.ghost_cells.setdefault((row, column), set()).add(ghost)
+    
+    def remaining_dots(self) -> int:
+        """Recount the dots on the board with popcount (dots_left tracks this incrementally)."""
+        return sum(board.bit_count() for board in self.dots)
+    
+    def frame(self) -> Frame:
+        """
+        Work out the touch flags at Pac-Man's cell and apply the game rules.
+    
+        Returns:
+            Frame - the flags and the results of eat_ghost, score, lose and win
+    
+        Purpose:
+            A dot or power pellet under Pac-Man is eaten, and a pellet starts
+            (or restarts) the power timer before the ghost check, so touching
+            a pellet and a ghost on the same frame eats the ghost. Eaten ghosts
+            go back to their starting cells. Nothing here depends on the size
+            of the maze or the number of dots left.
+        """
+        row, column = self.pacman
+        bit = 1 << column
+    
+        touching_dot = bool(self.dots[row] & bit)
+        if touching_dot:
+            self.dots[row] &= ~bit
+            self.dots_left -= 1
+    
+        touching_power_pellet = bool(self.pellets[row] & bit)
+        if touching_power_pellet:
+            self.pellets[row] &= ~bit
+            self.power_frames = self.power_duration
+    
+        power_pellet_active = self.power_frames > 0
+        touching_ghost = self.pacman in self.ghost_cells
+        has_eaten_all_dots = self.dots_left == 0
+    
+        ate_ghost = eat_ghost(power_pellet_active, touching_ghost)
+        if ate_ghost:
+            for ghost in list(self.ghost_cells[self.pacman]):
+                self.move_ghost(ghost, *self.ghost_starts[ghost])
+    
+        if self.power_frames:
+            self.power_frames -= 1
+    
+        return Frame(
+            touching_ghost=touching_ghost,
+            touching_dot=touching_dot,
+            touching_power_pellet=touching_power_pellet,
+            power_pellet_active=power_pellet_active,
+            has_eaten_all_dots=has_eaten_all_dots,
+            ate_ghost=ate_ghost,
+            scored=score(touching_power_pellet, touching_dot),
+            lost=lose(power_pellet_active, touching_ghost),
+            won=win(has_eaten_all_dots, power_pellet_active, touching_ghost),
+        )
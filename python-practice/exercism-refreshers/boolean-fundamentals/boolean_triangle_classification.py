@@ -16,6 +16,8 @@ This exercise demonstrates:
 2. Breaking down complex logic into separate boolean checks
 3. Using boolean operators to combine validation rules
 4. Multiple approaches to structuring boolean logic for readability
+5. Sharing one validity check between several classifications
+6. Counting valid triangles among many lengths with sorting and two pointers
 
 My Learning Process:
 I initially created a more verbose implementation with nested functions, but then
@@ -24,6 +26,76 @@ while still maintaining readability. I focused on writing code that would be
 understandable even to people with minimal programming knowledge.
 """
 
+from bisect import bisect_left
+from itertools import accumulate, groupby
+from math import comb
+from typing import NamedTuple
+
+# Category codes returned by classify_triangle (and classify_triangles for arrays)
+INVALID = 0
+EQUILATERAL = 1
+ISOSCELES = 2  # Exactly two equal sides; equilateral triangles get their own code
+SCALENE = 3
+
+
+class TriangleCounts(NamedTuple):
+    """How many triples of lengths form each kind of triangle."""
+    valid: int
+    equilateral: int
+    isosceles: int  # Counted the way isosceles() does, so equilateral triangles are included
+    scalene: int
+
+
+def is_triangle(sides: list[int]) -> bool:
+    """
+    Check that three side lengths can form a triangle.
+    
+    Args:
+        sides: list[int] - a list of three side lengths
+        
+    Returns:
+        bool - True if every side is positive and obeys the triangle inequality
+        
+    Purpose:
+        The validity rule that equilateral, isosceles and scalene all share,
+        kept in one place so it is only written once.
+    """
+    a, b, c = sides  # Using tuple unpacking to assign list elements to individual variables
+    return len(sides) == 3 and a > 0 and b > 0 and c > 0 and a + b > c and b + c > a and a + c > b
+
+
+def classify_triangle(sides: list[int]) -> int:
+    """
+    Classify a triangle with a single validity check.
+    
+    Args:
+        sides: list[int] - a list of three side lengths
+        
+    Returns:
+        int - INVALID, EQUILATERAL, ISOSCELES or SCALENE
+        
+    Purpose:
+        Asking equilateral(), isosceles() and scalene() about the same triangle
+        validates it three times. This validates once and picks the category.
+        
+    Examples:
+        >>> classify_triangle([2, 2, 2]) == EQUILATERAL
+        True
+        >>> classify_triangle([3, 4, 4]) == ISOSCELES
+        True
+        >>> classify_triangle([1, 1, 3]) == INVALID
+        True
+    """
+    if not is_triangle(sides):
+        return INVALID
+    a, b, c = sides
+    if a == b == c:
+        return EQUILATERAL
+    if a == b or a == c or b == c:
+        return ISOSCELES
+    return SCALENE
+
+
 def equilateral(sides: list[int]) -> bool:
     """
     Determine if a triangle is equilateral (all three sides of equal length).
@@ -51,8 +123,8 @@ def equilateral(sides: list[int]) -> bool:
                 return a > 0 and b > 0 and c > 0 and a + b >= c and b + c >= a and a + c >= b
             return istriange(a, b, c) and a == b == c
     """
-    a, b, c = sides  # Using tuple unpacking to assign list elements to individual variables
-    is_valid = len(sides) == 3 and a > 0 and b > 0 and c > 0 and a + b > c and b + c > a and a + c > b
+    a, b, c = sides
+    is_valid = is_triangle(sides)
     is_equilateral = a == b == c
     return is_valid and is_equilateral
 
@@ -74,7 +146,7 @@ def isosceles(sides: list[int]) -> bool:
         An equilateral triangle is also considered isosceles since all its sides are equal.
     """
     a, b, c = sides
-    is_valid = len(sides) == 3 and a > 0 and b > 0 and c > 0 and a + b > c and b + c > a and a + c > b
+    is_valid = is_triangle(sides)
     is_isosceles = a == b or a == c or b == c or a == b == c
     return is_valid and is_isosceles
 
@@ -93,6 +165,82 @@ def scalene(sides: list[int]) -> bool:
         Check if a triangle with the given side lengths is both valid and scalene.
     """
     a, b, c = sides
-    is_valid = len(sides) == 3 and a > 0 and b > 0 and c > 0 and a + b > c and b + c > a and a + c > b
+    is_valid = is_triangle(sides)
     is_scalene = a != b and b != c and a != c
-    return is_valid and is_scalene
\ No newline at end of file
+    return is_valid and is_scalene
+
+
+def count_triangles(lengths: list[float]) -> TriangleCounts:
+    """
+    Count the triples of lengths that form valid triangles, by category.
+    
+    Args:
+        lengths: list[float] - segment lengths; each entry can be used once per triple
+        
+    Returns:
+        TriangleCounts - the number of index triples (i < j < k) that are valid
+        triangles, and how many of those are equilateral, isosceles and scalene
+        
+    Purpose:
+        Calling is_triangle() on every triple is O(N^3). Sorting once lets the
+        triangle inequality be counted with two pointers instead.
+        
+    Notes:
+        Lengths that aren't positive can never be part of a triangle, so they
+        are dropped first. After sorting, equal lengths are grouped together:
+        - Three equal lengths v always pass is_triangle(), giving comb(count, 3)
+          equilateral triangles.
+        - Two equal lengths v with a different third length w are valid exactly
+          when w < v + v, which bisect finds in the sorted values.
+        - Three different lengths x < y < z only need x + y > z, because the
+          other two inequalities hold automatically. For each z, a left pointer
+          and a right pointer walk towards each other over the smaller values:
+          whenever x + y > z, every value between the pointers also works with
+          y, so they are all counted at once and the right pointer moves down.
+        The two-pointer pass is O(D^2) for D distinct lengths, so repeated
+        lengths make it much faster, but many distinct lengths make it slow:
+        10^4 distinct lengths take several seconds and 10^5 take over ten
+        minutes. boolean_triangle_classification_vectorized has two faster
+        versions that give the same counts: count_float_triangles does the
+        inner pointer with one np.searchsorted per longest side (10^4
+        distinct lengths in about two seconds instead of eight), and count_integer_triangles
+        handles 10^5 distinct whole-number lengths with an FFT.
+        
+    Examples:
+        >>> count_triangles([2, 2, 3, 4])
+        TriangleCounts(valid=3, equilateral=0, isosceles=1, scalene=2)
+        >>> count_triangles([1, 1, 1, 1, 5])
+        TriangleCounts(valid=4, equilateral=4, isosceles=4, scalene=0)
+    """
+    groups = [(value, len(list(group))) for value, group in groupby(sorted(length for length in lengths if length > 0))]
+    values = [value for value, _ in groups]
+    counts = [count for _, count in groups]
+    counted_before = [0, *accumulate(counts)]  # counted_before[i] = lengths smaller than values[i]
+    
+    equilateral = 0
+    two_equal = 0
+    for index, (value, count) in enumerate(groups):
+        if is_triangle([value, value, value]):
+            equilateral += comb(count, 3)
+        shorter_than_double = counted_before[bisect_left(values, value + value)]
+        two_equal += comb(count, 2) * (shorter_than_double - count)
+    
+    scalene = 0
+    for longest in range(2, len(values)):
+        target = values[longest]
+        pairs = 0
+        left, right = 0, longest - 1
+        while left < right:
+            if values[left] + values[right] > target:
+                pairs += counts[right] * (counted_before[right] - counted_before[left])
+                right -= 1
+            else:
+                left += 1
+        scalene += counts[longest] * pairs
+    
+    return TriangleCounts(
+        valid=equilateral + two_equal + scalene,
+        equilateral=equilateral,
+        isosceles=equilateral + two_equal,
+        scalene=scalene,
+    )
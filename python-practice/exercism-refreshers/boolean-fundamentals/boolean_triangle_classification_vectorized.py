@@ -0,0 +1,254 @@
+"""
+Vectorized Triangle Classification
+
+Context:
+Mesh data can hold tens of millions of triangles. Calling equilateral(),
+isosceles() and scalene() once per triangle means millions of Python calls and
+three validity checks per triangle. This module applies the same boolean rules
+to whole NumPy arrays at once, so each check runs a single time over every row.
+
+This exercise demonstrates:
+1. Translating boolean expressions into element-wise array operations
+2. Using & and | on boolean arrays instead of the and/or keywords
+3. Validating once and reusing the result for every category
+4. Returning compact category codes instead of several boolean lists
+5. Counting triangles among integer lengths with a histogram and an FFT
+6. Replacing a two-pointer walk with one np.searchsorted call per longest side
+
+Requires NumPy. The category codes are the ones defined in
+boolean_triangle_classification: INVALID, EQUILATERAL, ISOSCELES and SCALENE.
+"""
+
+from typing import Optional
+
+import numpy as np
+
+from boolean_triangle_classification import EQUILATERAL, INVALID, ISOSCELES, SCALENE, TriangleCounts
+
+MAX_HISTOGRAM_LENGTH = 1 << 20  # Largest length count_integer_triangles accepts; its FFT stays near 50 MB
+MAX_INTEGER_LENGTHS = 1 << 20   # Keeps FFT rounding error far below 0.5
+
+
+def valid_triangles(sides: np.ndarray) -> np.ndarray:
+    """
+    Check every row of an (N, 3) array against the triangle rules.
+    
+    Args:
+        sides: np.ndarray - an (N, 3) array of int or float side lengths
+    
+    Returns:
+        np.ndarray - a boolean array with one entry per row
+    
+    Notes:
+        Python's `and` can't be used on arrays because it asks for a single
+        True/False answer, so the element-wise `&` operator takes its place.
+        Each comparison needs its own parentheses because `&` binds tighter
+        than `>`.
+    """
+    a, b, c = sides[:, 0], sides[:, 1], sides[:, 2]
+    return (a > 0) & (b > 0) & (c > 0) & (a + b > c) & (b + c > a) & (a + c > b)
+
+
+def classify_triangles(sides, valid: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Classify many triangles at once.
+    
+    Args:
+        sides: array-like - an (N, 3) array (or list of rows) of side lengths
+        valid: np.ndarray - optional boolean array that replaces the
+            valid_triangles() check, for callers that know better which
+            rows are real triangles
+    
+    Returns:
+        np.ndarray - a uint8 category code per row: INVALID, EQUILATERAL,
+        ISOSCELES or SCALENE
+    
+    Raises:
+        ValueError: if the input isn't shaped (N, 3)
+    
+    Purpose:
+        Runs the validity check once for every row and derives all the
+        categories from it, agreeing with the scalar functions:
+        equilateral() is code == EQUILATERAL, isosceles() is code in
+        (EQUILATERAL, ISOSCELES) and scalene() is code == SCALENE.
+    
+    Notes:
+        Integer arrays use fixed-size NumPy integers, so side lengths close to
+        the int64 limit could overflow when two sides are added. Mesh data is
+        normally float, where sums never wrap around.
+    
+    Examples:
+        >>> classify_triangles([[2, 2, 2], [3, 4, 4], [3, 4, 5], [1, 1, 3]]).tolist()
+        [1, 2, 3, 0]
+        >>> classify_triangles(np.array([[0.5, 0.4, 0.3]])).tolist()
+        [3]
+    """
+    sides = np.asarray(sides)
+    if sides.ndim != 2 or sides.shape[1] != 3:
+        raise ValueError(f'expected an (N, 3) array of side lengths, got shape {sides.shape}')
+    
+    a, b, c = sides[:, 0], sides[:, 1], sides[:, 2]
+    a_equals_b = a == b
+    b_equals_c = b == c
+    
+    codes = np.full(len(sides), SCALENE, dtype=np.uint8)
+    codes[a_equals_b | b_equals_c | (a == c)] = ISOSCELES
+    codes[a_equals_b & b_equals_c] = EQUILATERAL
+    codes[~(valid_triangles(sides) if valid is None else valid)] = INVALID
+    return codes
+
+
+def count_float_triangles(lengths) -> TriangleCounts:
+    """
+    count_triangles() with the two-pointer walk replaced by np.searchsorted.
+    
+    Args:
+        lengths: array-like - segment lengths, whole numbers or not
+    
+    Returns:
+        TriangleCounts - the same counts count_triangles() gives
+    
+    Purpose:
+        count_triangles() walks two pointers in Python for every longest side,
+        which makes 10^4 distinct lengths take seconds. For a longest side z,
+        only middle sides y above z / 2 can have an x < y with x + y > z.
+        Since the values are sorted, one np.searchsorted call finds, for every
+        such y at once, the first x that is large enough. So each longest side
+        costs one vectorized call instead of a Python loop over the values.
+    
+    Notes:
+        Searching for z - y can land one place off from where x + y > z
+        changes, because z - y and x + y round differently. The boundary is
+        nudged until x + y > z itself agrees, so the counts match the
+        comparison is_triangle() makes. The work is still O(D^2) for D
+        distinct lengths, just done inside NumPy: 10^4 distinct lengths take
+        about two seconds, against about eight for count_triangles().
+    
+    Examples:
+        >>> count_float_triangles([2, 2, 3, 4])
+        TriangleCounts(valid=3, equilateral=0, isosceles=1, scalene=2)
+        >>> from boolean_triangle_classification import count_triangles
+        >>> lengths = np.random.default_rng(0).uniform(-1, 10, 400).round(1)
+        >>> count_float_triangles(lengths) == count_triangles(lengths.tolist())
+        True
+    """
+    lengths = np.asarray(lengths)
+    values, counts = np.unique(lengths[lengths > 0], return_counts=True)
+    counts = counts.astype(np.int64)
+    counted_before = np.concatenate([[0], np.cumsum(counts)])  # counted_before[i] = lengths smaller than values[i]
+    
+    equilateral_counts = np.where(values + values > values, counts * (counts - 1) * (counts - 2) // 6, 0)
+    equilateral = int(equilateral_counts.sum())
+    shorter_than_double = counted_before[np.searchsorted(values, values + values)]
+    two_equal = int((counts * (counts - 1) // 2 * (shorter_than_double - counts)).sum())
+    
+    scalene = 0
+    for longest in range(2, len(values)):
+        target = values[longest]
+        smallest_middle = np.searchsorted(values, target / 2, side='right')  # y <= z / 2 leaves no x
+        if smallest_middle >= longest:
+            continue
+        middles = values[smallest_middle:longest]
+        first = np.searchsorted(values, target - middles, side='right')
+        while True:  # Move each boundary to where values[first] + y > target starts
+            back = (first > 0) & (values[np.maximum(first - 1, 0)] + middles > target)
+            ahead = values[first] + middles <= target  # first can't pass y, because y + y > target
+            if not (back.any() or ahead.any()):
+                break
+            first = first - back + ahead
+        middle_indexes = np.arange(smallest_middle, longest)
+        first = np.minimum(first, middle_indexes)  # x must be smaller than y
+        pairs = np.dot(counts[middle_indexes], counted_before[middle_indexes] - counted_before[first])
+        scalene += int(counts[longest]) * int(pairs)
+    
+    return TriangleCounts(
+        valid=equilateral + two_equal + scalene,
+        equilateral=equilateral,
+        isosceles=equilateral + two_equal,
+        scalene=scalene,
+    )
+
+
+def count_integer_triangles(lengths) -> TriangleCounts:
+    """
+    count_triangles() for whole-number lengths, without the quadratic pass.
+    
+    Args:
+        lengths: array-like - whole-number segment lengths
+    
+    Returns:
+        TriangleCounts - the same counts count_triangles() gives
+    
+    Raises:
+        ValueError: if a length isn't a whole number, a length is above
+            MAX_HISTOGRAM_LENGTH or there are more than MAX_INTEGER_LENGTHS lengths
+    
+    Purpose:
+        count_triangles() needs a pass over the distinct lengths for every
+        longest side, which is quadratic. With whole numbers the lengths can
+        go in a histogram instead. Convolving the histogram with itself (an FFT
+        and its inverse) gives, for every possible sum, how many pairs of
+        lengths add up to it. A triple with three different lengths x < y < z
+        fails exactly when x + y <= z. So the failing triples are the pairs
+        with each sum, times the lengths at least that sum. Subtracting those
+        from every triple of different lengths leaves the scalene count. This
+        takes O(M log M) for a largest length M, however many distinct
+        lengths there are.
+    
+    Notes:
+        The FFT works in floats, and its results are rounded back to whole
+        pair counts. The limit on the number of lengths keeps the rounding
+        error far below 0.5. The limit on the largest length bounds memory:
+        the FFT runs over twice the largest length, rounded up to a power of
+        two, so 2**20 needs about 50 MB while 2**24 would need over 1 GB.
+        Longer lengths should go to count_float_triangles() instead.
+    
+    Examples:
+        >>> count_integer_triangles([2, 2, 3, 4])
+        TriangleCounts(valid=3, equilateral=0, isosceles=1, scalene=2)
+        >>> from boolean_triangle_classification import count_triangles
+        >>> lengths = np.random.default_rng(0).integers(0, 60, 300)
+        >>> count_integer_triangles(lengths) == count_triangles(lengths.tolist())
+        True
+    """
+    lengths = np.asarray(lengths)
+    if lengths.size and not np.all(np.mod(lengths, 1) == 0):
+        raise ValueError('count_integer_triangles only takes whole-number lengths')
+    lengths = lengths[lengths > 0].astype(np.int64)
+    if len(lengths) > MAX_INTEGER_LENGTHS:
+        raise ValueError(f'at most {MAX_INTEGER_LENGTHS} lengths are supported')
+    if len(lengths) and lengths.max() > MAX_HISTOGRAM_LENGTH:
+        raise ValueError(f'lengths above {MAX_HISTOGRAM_LENGTH} are not supported')
+    if not len(lengths):
+        return TriangleCounts(0, 0, 0, 0)
+    
+    histogram = np.bincount(lengths)  # histogram[v] = how many lengths equal v
+    values = np.flatnonzero(histogram)
+    counts = histogram[values]
+    below = np.concatenate([[0], np.cumsum(histogram)])  # below[t] = lengths shorter than t
+    
+    equilateral = int((counts * (counts - 1) * (counts - 2) // 6).sum())
+    shorter_than_double = below[np.minimum(2 * values, len(histogram))]
+    two_equal = int((counts * (counts - 1) // 2 * (shorter_than_double - counts)).sum())
+    
+    sums = 2 * len(histogram) - 1
+    size = 1 << (sums - 1).bit_length()
+    spectrum = np.fft.rfft(histogram, size)
+    pairs = np.rint(np.fft.irfft(spectrum * spectrum, size)[:sums]).astype(np.int64)
+    pairs[2 * values] -= counts * counts  # Drop pairs of two equal lengths
+    pairs //= 2                            # Each unordered pair was counted twice
+    at_least = len(lengths) - below[np.minimum(np.arange(sums), len(histogram))]
+    failing = int(np.dot(pairs, at_least))
+    
+    total = len(lengths)
+    squares = sum(count ** 2 for count in counts.tolist())
+    cubes = sum(count ** 3 for count in counts.tolist())
+    different = (total ** 3 - 3 * total * squares + 2 * cubes) // 6  # Triples with three different lengths
+    scalene = different - failing
+    
+    return TriangleCounts(
+        valid=equilateral + two_equal + scalene,
+        equilateral=equilateral,
+        isosceles=equilateral + two_equal,
+        scalene=scalene,
+    )
@@ -0,0 +1,293 @@
+"""
+Mesh Quality Scan
+
+Context:
+A triangle mesh is stored as two packed binary files: one with the x, y, z
+coordinates of every vertex and one with three vertex indexes per face. These
+files can be much larger than memory, so this tool memory-maps them and walks
+through the faces one chunk at a time. For each face it works out the three
+edge lengths and classifies the face with the same rules as
+boolean_triangle_classification. A face is degenerate when its corners are a
+repeated vertex, have a zero-length edge or lie on a line.
+
+This exercise demonstrates:
+1. Memory-mapping binary files with numpy.memmap instead of reading them
+2. Processing a large dataset in fixed-size chunks
+3. Gathering vertex coordinates for many faces with fancy indexing
+4. Reusing classify_triangles so the mesh and the exercise agree on the rules
+5. Accumulating statistics as the data streams past
+6. Testing for degenerate faces with a tolerance instead of exact comparisons
+
+Requires NumPy. By default vertices are little-endian float32 and faces are
+little-endian uint32, the layout most mesh exporters use for raw buffers.
+
+Notes:
+Three float32 points on a line rarely give edge lengths where a + b == c
+exactly. Rounding usually leaves a + b a hair bigger, so the exact triangle
+rules would pass most of them. Degeneracy is therefore judged by the face's
+relative area: twice its area (the length of the cross product of two edges)
+divided by its longest edge and by its reach, the larger of that edge and the
+biggest coordinate among its corners. A face near the origin scores about
+0.87 when equilateral and a repeated vertex scores 0.
+
+Storing a coordinate rounds it by up to half the dtype's machine epsilon (eps)
+times its size, so every corner can sit up to about eps * reach away from where
+it was meant to be. Moving the corners that little changes the relative area
+by at most about 2 * sqrt(3) * eps, so anything below that could be a flat face
+that rounding bent. The cutoff is DEGENERATE_ULPS times the eps of the vertex
+dtype: about 4.8e-7 for float32 and 8.9e-16 for float64. A face is only called
+degenerate when rounding its own coordinates could explain its area, however
+small it is or however far from the origin it sits.
+"""
+
+from typing import Iterator, NamedTuple, Optional
+
+import numpy as np
+
+from boolean_triangle_classification import EQUILATERAL, INVALID, ISOSCELES, SCALENE
+from boolean_triangle_classification_vectorized import classify_triangles
+
+CATEGORY_NAMES = {INVALID: 'degenerate', EQUILATERAL: 'equilateral', ISOSCELES: 'isosceles', SCALENE: 'scalene'}
+CHUNK_FACES = 1 << 20  # About 12 MB of face indexes per chunk
+DEGENERATE_ULPS = 4  # Cutoff in units of the vertex dtype's eps (rounding can account for about 3.5)
+
+
+class MeshChunk(NamedTuple):
+    """Edge lengths and categories for one chunk of faces."""
+    start: int
+    edge_lengths: np.ndarray
+    categories: np.ndarray
+
+
+class MeshStats(NamedTuple):
+    """Totals for a whole mesh."""
+    faces: int
+    category_counts: dict
+    ratio_histogram: np.ndarray
+    ratio_bin_edges: np.ndarray
+    min_edge: float
+    max_edge: float
+    mean_edge: float
+    degenerate_faces: np.ndarray
+
+
+def open_mesh(vertex_path: str, face_path: str, vertex_dtype='<f4', face_dtype='<u4') -> tuple:
+    """
+    Memory-map a packed vertex file and face file.
+    
+    Args:
+        vertex_path: str - file of packed x, y, z coordinates
+        face_path: str - file of packed vertex index triples
+        vertex_dtype: NumPy dtype of one coordinate
+        face_dtype: NumPy dtype of one vertex index
+    
+    Returns:
+        tuple - (vertices, faces) as read-only (V, 3) and (F, 3) memmaps
+    
+    Notes:
+        Nothing is read here; the operating system pages the data in as
+        the arrays are used.
+    """
+    vertices = np.memmap(vertex_path, dtype=vertex_dtype, mode='r').reshape(-1, 3)
+    faces = np.memmap(face_path, dtype=face_dtype, mode='r').reshape(-1, 3)
+    return vertices, faces
+
+
+def write_mesh(vertex_path: str, face_path: str, vertices, faces, vertex_dtype='<f4', face_dtype='<u4'):
+    """Write vertices and faces in the packed layout that open_mesh() reads."""
+    np.asarray(vertices, dtype=vertex_dtype).tofile(vertex_path)
+    np.asarray(faces, dtype=face_dtype).tofile(face_path)
+
+
+def face_geometry(vertices: np.ndarray, faces: np.ndarray) -> tuple:
+    """
+    Work out the three edge lengths and the relative area of every face.
+    
+    Args:
+        vertices: np.ndarray - (V, 3) vertex coordinates
+        faces: np.ndarray - (N, 3) vertex indexes
+    
+    Returns:
+        tuple - (N, 3) float64 edge lengths, each opposite one corner, and an
+        (N,) array of relative areas (see the module docstring); a face whose
+        corners are all the same point gets 0
+    
+    Examples:
+        >>> lengths, areas = face_geometry(np.array([[0, 0, 0], [1, 0, 0], [2, 0, 0], [0, 1, 0]]),
+        ...                                np.array([[0, 1, 2], [0, 1, 3], [0, 0, 0]]))
+        >>> lengths[1].round(4).tolist(), areas.round(4).tolist()
+        ([1.4142, 1.0, 1.0], [0.0, 0.5, 0.0])
+    """
+    corner_one = vertices[faces[:, 0]].astype(np.float64)
+    corner_two = vertices[faces[:, 1]].astype(np.float64)
+    corner_three = vertices[faces[:, 2]].astype(np.float64)
+    edge_lengths = np.stack([
+        np.linalg.norm(corner_two - corner_three, axis=1),
+        np.linalg.norm(corner_three - corner_one, axis=1),
+        np.linalg.norm(corner_one - corner_two, axis=1),
+    ], axis=1)
+    twice_areas = np.linalg.norm(np.cross(corner_two - corner_one, corner_three - corner_one), axis=1)
+    longest = edge_lengths.max(axis=1, initial=0.0)
+    reach = np.maximum.reduce([longest] + [np.abs(corner).max(axis=1, initial=0.0)
+                                           for corner in (corner_one, corner_two, corner_three)])
+    relative_areas = np.divide(twice_areas, longest * reach, out=np.zeros_like(twice_areas), where=longest > 0)
+    return edge_lengths, relative_areas
+
+
+def degenerate_tolerance(vertex_dtype) -> float:
+    """
+    Relative area at or below which rounding the coordinates could explain a face's area.
+    
+    Args:
+        vertex_dtype: NumPy dtype of one coordinate
+    
+    Returns:
+        float - DEGENERATE_ULPS times the dtype's eps; 0.0 for integer
+        coordinates, which are stored exactly
+    
+    Examples:
+        >>> degenerate_tolerance('<f4') == 4 * float(np.finfo(np.float32).eps)
+        True
+        >>> degenerate_tolerance(np.int32)
+        0.0
+    """
+    dtype = np.dtype(vertex_dtype)
+    if not np.issubdtype(dtype, np.floating):
+        return 0.0
+    return DEGENERATE_ULPS * float(np.finfo(dtype).eps)
+
+
+def face_edge_lengths(vertices: np.ndarray, faces: np.ndarray) -> np.ndarray:
+    """
+    Work out the three edge lengths of every face.
+    
+    Args:
+        vertices: np.ndarray - (V, 3) vertex coordinates
+        faces: np.ndarray - (N, 3) vertex indexes
+    
+    Returns:
+        np.ndarray - (N, 3) float64 edge lengths, each opposite one corner
+    """
+    return face_geometry(vertices, faces)[0]
+
+
+def iter_mesh_chunks(vertices: np.ndarray, faces: np.ndarray, chunk_faces: int = CHUNK_FACES,
+                     decimals: Optional[int] = None,
+                     tolerance: Optional[float] = None) -> Iterator[MeshChunk]:
+    """
+    Classify the faces of a mesh one chunk at a time.
+    
+    Args:
+        vertices: np.ndarray - (V, 3) vertex coordinates, usually a memmap
+        faces: np.ndarray - (F, 3) vertex indexes, usually a memmap
+        chunk_faces: int - how many faces to handle at once
+        decimals: int - round edge lengths to this many decimals before
+            classifying, so nearly equal edges count as equal; None compares
+            them exactly, like the scalar functions do
+        tolerance: float - relative area at or below which a face is
+            degenerate; None derives it from the vertex dtype with
+            degenerate_tolerance()
+    
+    Returns:
+        An iterator of MeshChunk, in face order
+    
+    Purpose:
+        Only one chunk of faces and its edge lengths is in memory at a time,
+        so the size of the mesh doesn't matter. The relative area decides
+        which faces are degenerate, and classify_triangles only sorts the
+        rest into equilateral, isosceles and scalene.
+    
+    Examples:
+        >>> points = np.linspace(0, 1, 3000, dtype=np.float32)
+        >>> line = np.stack([points, 3 * points, np.full_like(points, 0.1)], axis=1)
+        >>> faces = np.random.default_rng(0).integers(0, 3000, (1000, 3))
+        >>> [int((chunk.categories == INVALID).sum()) for chunk in iter_mesh_chunks(line, faces, 400)]
+        [400, 400, 200]
+    
+        A 1 mm equilateral face 1 km from the origin is only about 16 float32
+        steps wide, but it is still a real triangle; the same corners on a line
+        are not:
+    
+        >>> far = np.array([[1000, 1000, 0], [1000.001, 1000, 0], [1000.0005, 1000.000866, 0],
+        ...                 [1000.002, 1000, 0]], dtype=np.float32)
+        >>> (next(iter_mesh_chunks(far, np.array([[0, 1, 2], [0, 1, 3]]))).categories == INVALID).tolist()
+        [False, True]
+    """
+    if tolerance is None:
+        tolerance = degenerate_tolerance(vertices.dtype)
+    for start in range(0, len(faces), chunk_faces):
+        edge_lengths, relative_areas = face_geometry(vertices, np.asarray(faces[start:start + chunk_faces]))
+        compared = edge_lengths if decimals is None else np.round(edge_lengths, decimals)
+        yield MeshChunk(start, edge_lengths, classify_triangles(compared, valid=relative_areas > tolerance))
+
+
+def scan_mesh(vertex_path: str, face_path: str, vertex_dtype='<f4', face_dtype='<u4',
+              chunk_faces: int = CHUNK_FACES, bins: int = 10, decimals: Optional[int] = None,
+              tolerance: Optional[float] = None) -> MeshStats:
+    """
+    Scan a mesh on disk and summarize the quality of its faces.
+    
+    Args:
+        vertex_path: str - file of packed x, y, z coordinates
+        face_path: str - file of packed vertex index triples
+        vertex_dtype: NumPy dtype of one coordinate
+        face_dtype: NumPy dtype of one vertex index
+        chunk_faces: int - how many faces to handle at once
+        bins: int - number of bins for the edge-ratio histogram
+        decimals: int - rounding used when comparing edge lengths (see iter_mesh_chunks)
+        tolerance: float - relative area at or below which a face is
+            degenerate; None derives it from vertex_dtype
+    
+    Returns:
+        MeshStats - face counts per category, a histogram of shortest/longest
+        edge ratio for non-degenerate faces (1.0 is a perfect equilateral),
+        edge length extremes and mean, and the indexes of degenerate faces
+    
+    Examples:
+        >>> import os, tempfile
+        >>> folder = tempfile.mkdtemp()
+        >>> vertex_path, face_path = os.path.join(folder, 'v.bin'), os.path.join(folder, 'f.bin')
+        >>> write_mesh(vertex_path, face_path,
+        ...            [[0, 0, 0], [2, 0, 0], [1, 3, 0], [4, 0, 0]],
+        ...            [[0, 1, 2], [0, 1, 3], [1, 1, 2]])
+        >>> stats = scan_mesh(vertex_path, face_path, chunk_faces=2)
+        >>> stats.category_counts
+        {'degenerate': 2, 'equilateral': 0, 'isosceles': 1, 'scalene': 0}
+        >>> stats.degenerate_faces.tolist()
+        [1, 2]
+    """
+    vertices, faces = open_mesh(vertex_path, face_path, vertex_dtype, face_dtype)
+    
+    category_counts = np.zeros(len(CATEGORY_NAMES), dtype=np.int64)
+    ratio_histogram = np.zeros(bins, dtype=np.int64)
+    ratio_bin_edges = np.linspace(0.0, 1.0, bins + 1)
+    degenerate_chunks = []
+    min_edge, max_edge, edge_sum = np.inf, 0.0, 0.0
+    
+    for chunk in iter_mesh_chunks(vertices, faces, chunk_faces, decimals, tolerance):
+        category_counts += np.bincount(chunk.categories, minlength=len(CATEGORY_NAMES))
+    
+        degenerate = chunk.categories == INVALID
+        degenerate_chunks.append(np.flatnonzero(degenerate) + chunk.start)
+    
+        good_lengths = chunk.edge_lengths[~degenerate]
+        if len(good_lengths):
+            ratios = good_lengths.min(axis=1) / good_lengths.max(axis=1)
+            ratio_histogram += np.histogram(ratios, bins=ratio_bin_edges)[0]
+    
+        if chunk.edge_lengths.size:
+            min_edge = min(min_edge, float(chunk.edge_lengths.min()))
+            max_edge = max(max_edge, float(chunk.edge_lengths.max()))
+            edge_sum += float(chunk.edge_lengths.sum())
+    
+    face_count = len(faces)
+    return MeshStats(
+        faces=face_count,
+        category_counts={name: int(category_counts[code]) for code, name in sorted(CATEGORY_NAMES.items())},
+        ratio_histogram=ratio_histogram,
+        ratio_bin_edges=ratio_bin_edges,
+        min_edge=min_edge if face_count else 0.0,
+        max_edge=max_edge,
+        mean_edge=edge_sum / (3 * face_count) if face_count else 0.0,
+        degenerate_faces=np.concatenate(degenerate_chunks) if degenerate_chunks else np.empty(0, dtype=np.int64),
+    )
@@ -13,12 +13,28 @@ This exercise demonstrates:
 4. Using membership testing with the 'in' operator
 5. Short-circuiting conditions with logical operators
 6. Function composition for code reuse
+7. Precomputing a lookup table so each hand is evaluated with one index
 
 Resources:
 - How to play blackjack: https://bicyclecards.com/how-to-play/blackjack/
 - Standard playing cards: https://en.wikipedia.org/wiki/Standard_52-card_deck
 """
 
+from typing import NamedTuple, Union
+
+CARDS = ('A', '2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K')
+CARD_CODES = {card: code for code, card in enumerate(CARDS)}  # Cards interned as small ints 0-12
+
+
+class PairEvaluation(NamedTuple):
+    """Everything the rules say about a two-card hand, as stored in PAIR_TABLE."""
+    total: int
+    higher: Union[str, tuple]
+    ace_value: int
+    blackjack: bool
+    split: bool
+    double_down: bool
+
 
 def value_of_card(card):
     """
@@ -64,12 +80,19 @@ def higher_card(card_one, card_two):
     Notes:
         Uses the value_of_card function to avoid duplicating valuation logic.
         When cards are equal, returns a tuple using the comma syntax in the return statement.
+        The comparison now runs once per card pair when PAIR_TABLE is built.
+        
+    Examples:
+        >>> higher_card('K', '10')
+        ('K', '10')
+        >>> higher_card('1', '2')
+        '2'
+        >>> higher_card('X', '2')
+        Traceback (most recent call last):
+        ...
+        ValueError: invalid literal for int() with base 10: 'X'
     """
-    if value_of_card(card_one) > value_of_card(card_two):
-        return card_one
-    if value_of_card(card_one) < value_of_card(card_two):
-        return card_two
-    return card_one, card_two
+    return evaluate_pair(card_one, card_two).higher
 
 
 def value_of_ace(card_one, card_two):
@@ -90,12 +113,13 @@ def value_of_ace(card_one, card_two):
     Notes:
         Uses the 'in' operator with a tuple to check if either card is an ace:
         'A' in (card_one, card_two) - this was a new syntax I learned.
+        The rule itself now lives in _evaluate_with_rules() and is looked up
+        from PAIR_TABLE. The ace check stays in front of the lookup, so a
+        hand with an ace answers 1 whatever the other card is, as it always has.
     """
-    if 'A' in (card_one, card_two):  # New syntax I learned instead of card_one == 'A' or card_two == 'A'
+    if 'A' in (card_one, card_two):
         return 1
-    if (value_of_card(card_one) + value_of_card(card_two)) > 10:
-        return 1
-    return 11
+    return evaluate_pair(card_one, card_two).ace_value
 
 
 def is_blackjack(card_one, card_two):
@@ -117,7 +141,7 @@ def is_blackjack(card_one, card_two):
         Uses a combination of conditions with logical operators to determine
         if the hand contains both an ace and a 10-value card.
     """
-    return (value_of_card(card_one) == 10 or value_of_card(card_two) == 10) and (card_one == 'A' or card_two == 'A')
+    return evaluate_pair(card_one, card_two).blackjack
 
 
 def can_split_pairs(card_one, card_two):
@@ -139,7 +163,7 @@ def can_split_pairs(card_one, card_two):
         Uses the value_of_card function to determine if both cards
         have the same value, regardless of their face representation.
     """
-    return value_of_card(card_one) == value_of_card(card_two)
+    return evaluate_pair(card_one, card_two).split
 
 
 def can_double_down(card_one, card_two):
@@ -161,4 +185,95 @@ def can_double_down(card_one, card_two):
         Uses chained comparison (9 <= x <= 11) to check if the total is
         between 9 and 11 inclusive.
     """
-    return 9 <= (value_of_card(card_one) + value_of_card(card_two)) <= 11
\ No newline at end of file
+    return evaluate_pair(card_one, card_two).double_down
+
+
+def _evaluate_with_rules(card_one, card_two):
+    """
+    Apply every two-card rule to a pair of cards, valuing each card only once.
+    
+    Args:
+        card_one: str - first card in hand
+        card_two: str - second card in hand
+        
+    Returns:
+        PairEvaluation - the total and every flag for the hand
+        
+    Purpose:
+        This is where the rules themselves live. It only runs 169 times,
+        while PAIR_TABLE is being built.
+    """
+    value_one = value_of_card(card_one)
+    value_two = value_of_card(card_two)
+    total = value_one + value_two
+    
+    if value_one > value_two:
+        higher = card_one
+    elif value_one < value_two:
+        higher = card_two
+    else:
+        higher = (card_one, card_two)
+    
+    has_ace = 'A' in (card_one, card_two)  # Instead of card_one == 'A' or card_two == 'A'
+    
+    return PairEvaluation(
+        total=total,
+        higher=higher,
+        ace_value=1 if has_ace or total > 10 else 11,
+        blackjack=has_ace and (value_one == 10 or value_two == 10),
+        split=value_one == value_two,
+        double_down=9 <= total <= 11,
+    )
+
+
+# Blackjack value of each card code, taken straight from value_of_card
+CARD_VALUES = tuple(value_of_card(card) for card in CARDS)
+
+# All 13 x 13 ordered pairs, indexed by code_one * 13 + code_two
+PAIR_TABLE = tuple(
+    _evaluate_with_rules(card_one, card_two)
+    for card_one in CARDS
+    for card_two in CARDS
+)
+
+
+def evaluate_pair(card_one, card_two):
+    """
+    Look up every rule for a two-card hand at once.
+    
+    Args:
+        card_one: str - first card in hand
+        card_two: str - second card in hand
+        
+    Returns:
+        PairEvaluation - total, higher card, ace value and the blackjack,
+        split and double down flags
+        
+    Raises:
+        ValueError: if value_of_card can't read one of the cards
+        
+    Purpose:
+        Each helper used to call value_of_card again, so checking one hand
+        parsed each card up to ten times. Every pair is now evaluated once
+        when the module loads and this is a single table index.
+        
+    Notes:
+        Cards outside CARDS, like '1' or 'X', miss the table and are
+        evaluated by the rules directly. That keeps the behaviour the helpers
+        had before the table: value_of_card accepts '1' and raises ValueError
+        for anything it can't read.
+        
+    Examples:
+        >>> evaluate_pair('A', 'K').blackjack
+        True
+        >>> evaluate_pair('5', '6')
+        PairEvaluation(total=11, higher='6', ace_value=1, blackjack=False, split=False, double_down=True)
+        >>> evaluate_pair('k', '6')
+        Traceback (most recent call last):
+        ...
+        ValueError: invalid literal for int() with base 10: 'k'
+    """
+    try:
+        return PAIR_TABLE[CARD_CODES[card_one] * 13 + CARD_CODES[card_two]]
+    except KeyError:  # Not one of CARDS, so value_of_card decides
+        return _evaluate_with_rules(card_one, card_two)
@@ -0,0 +1,115 @@
+"""
+Blackjack Hand State
+
+Context:
+value_of_ace and the other helpers in comparisons_blackjack only reason about
+exactly two cards. Hands grow as the player hits, and re-summing every card on
+each hit wastes time when millions of hands are in play at once. This module
+keeps a small running summary of a hand instead of the list of its cards.
+
+This exercise demonstrates:
+1. Using __slots__ to keep many small objects cheap in memory
+2. Updating a running total in O(1) instead of re-summing a list
+3. Deriving soft/hard status from a hard total and an ace count
+4. Reusing PAIR_TABLE for the rules that only apply to the first two cards
+
+A hand remembers its hard total (every ace counted as 1), how many aces it
+holds and how many cards it has. At most one ace can ever count as 11, so
+that's all that is needed to answer every question about the hand.
+"""
+
+from comparisons_blackjack import CARD_CODES, CARD_VALUES, PAIR_TABLE
+
+ACE = CARD_CODES['A']
+
+
+class Hand:
+    """
+    A blackjack hand that can grow one card at a time.
+    
+    Examples:
+        >>> hand = Hand('A', '6')
+        >>> hand.value, hand.is_soft
+        (17, True)
+        >>> hand.add_card('9')
+        >>> hand.value, hand.is_soft, hand.is_bust
+        (16, False, False)
+        >>> Hand('K', 'A').is_blackjack
+        True
+        >>> Hand('8', '8').is_pair
+        True
+    """
+    __slots__ = ('hard_total', 'aces', 'size', 'first', 'opening')
+    
+    def __init__(self, *cards):
+        self.hard_total = 0
+        self.aces = 0
+        self.size = 0
+        self.first = None    # Code of the first card, until the second one arrives
+        self.opening = None  # PAIR_TABLE entry for the first two cards
+        for card in cards:
+            self.add_card(card)
+    
+    def add_card(self, card):
+        """
+        Add a card given as a string such as 'A', '7' or 'K'.
+    
+        Args:
+            card: str - the card being dealt to this hand
+    
+        Raises:
+            KeyError: if the card is not one of comparisons_blackjack.CARDS
+        """
+        self.add_code(CARD_CODES[card])
+    
+    def add_code(self, code):
+        """
+        Add a card given as its small integer code (see comparisons_blackjack.CARDS).
+    
+        Args:
+            code: int - the card code, 0 for an ace up to 12 for a king
+    
+        Notes:
+            Only a few integers change, so this is O(1) no matter how
+            many cards the hand already holds.
+        """
+        self.hard_total += CARD_VALUES[code]
+        self.aces += code == ACE
+        self.size += 1
+        if self.size == 1:
+            self.first = code
+        elif self.size == 2:
+            self.opening = PAIR_TABLE[self.first * 13 + code]
+    
+    @property
+    def is_soft(self) -> bool:
+        """True when an ace is currently counted as 11."""
+        return self.aces > 0 and self.hard_total <= 11
+    
+    @property
+    def value(self) -> int:
+        """The best total for the hand, counting one ace as 11 when that doesn't bust."""
+        return self.hard_total + 10 if self.is_soft else self.hard_total
+    
+    @property
+    def is_bust(self) -> bool:
+        return self.hard_total > 21
+    
+    @property
+    def is_blackjack(self) -> bool:
+        """A natural: exactly two cards, an ace and a ten-value card."""
+        return self.size == 2 and self.opening.blackjack
+    
+    @property
+    def is_pair(self) -> bool:
+        """True for a two-card hand that can_split_pairs would allow splitting."""
+        return self.size == 2 and self.opening.split
+    
+    @property
+    def can_double_down(self) -> bool:
+        """True for a two-card hand that can_double_down would allow doubling."""
+        return self.size == 2 and self.opening.double_down
+    
+    def __repr__(self):
+        kind = 'soft' if self.is_soft else 'hard'
+        return f'Hand({kind} {self.value}, {self.size} cards)'
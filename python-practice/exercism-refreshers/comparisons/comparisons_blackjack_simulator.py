@@ -0,0 +1,289 @@
+"""
+Blackjack Monte Carlo Simulator
+
+Context:
+The rule functions in comparisons_blackjack answer questions about a single
+hand. To compare house-rule variants we need to deal a huge number of hands
+and measure the player's expected value (EV) and how often each rule fires.
+Calling the string-based helpers for every hand is far too slow for that, so
+this simulator deals small integer card codes from an array-backed shoe and
+reads the rules from the precomputed PAIR_TABLE.
+
+This exercise demonstrates:
+1. Storing a multi-deck shoe compactly in an array of card codes
+2. Shuffling the whole shoe at once with NumPy instead of drawing random cards one by one
+3. Reusing precomputed rule tables instead of re-evaluating strings
+4. Splitting work into independent seeded streams across a process pool
+5. Making random simulations reproducible from a single seed
+
+The player follows the rule functions directly: split when can_split_pairs
+allows it, double down when can_double_down allows it, and otherwise draw
+until reaching 17, just like the dealer.
+
+Requires NumPy.
+"""
+
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple, Optional
+
+import numpy as np
+
+from comparisons_blackjack import CARD_VALUES, PAIR_TABLE
+
+ACE = 0  # Card code of 'A' in comparisons_blackjack.CARDS
+
+
+class HouseRules(NamedTuple):
+    """One house-rule variant to simulate."""
+    decks: int = 6
+    penetration: float = 0.75
+    blackjack_payout: float = 1.5
+    dealer_hits_soft_17: bool = False
+    allow_split: bool = True
+    allow_double: bool = True
+
+
+class SimulationResult(NamedTuple):
+    """Totals gathered from one or more simulated streams."""
+    rounds: int
+    total_return: float
+    counts: dict
+    
+    @property
+    def ev(self) -> float:
+        """Average return per round, in units of the initial bet."""
+        return self.total_return / self.rounds if self.rounds else 0.0
+    
+    @property
+    def frequencies(self) -> dict:
+        """How often each rule or outcome happened, per round dealt."""
+        return {name: count / self.rounds for name, count in sorted(self.counts.items())}
+
+
+class Shoe:
+    """
+    A multi-deck shoe stored as an array of card codes.
+    
+    The whole shoe is shuffled in one NumPy call and cards are dealt by moving
+    a position along it, so drawing a card is just an index lookup. The
+    shuffled codes are copied into a bytes object, because indexing bytes
+    gives a plain int, which is faster than reading one NumPy scalar at a time.
+    """
+    __slots__ = ('codes', 'cards', 'position', 'cut_card', 'rng')
+    
+    def __init__(self, decks: int, penetration: float, rng: np.random.Generator):
+        self.codes = np.tile(np.arange(13, dtype=np.uint8), 4 * decks)
+        self.cut_card = int(len(self.codes) * penetration)
+        self.rng = rng
+        self.shuffle()
+    
+    def shuffle(self):
+        self.rng.shuffle(self.codes)
+        self.cards = self.codes.tobytes()
+        self.position = 0
+    
+    def needs_shuffle(self) -> bool:
+        return self.position >= self.cut_card
+    
+    def draw(self) -> int:
+        if self.position == len(self.cards):  # Only happens with very deep penetration
+            self.shuffle()
+        card = self.cards[self.position]
+        self.position += 1
+        return card
+
+
+def best_total(hard_total: int, aces: int) -> int:
+    """
+    Count one ace as 11 when that doesn't bust the hand.
+    
+    Args:
+        hard_total: int - sum of the card values with every ace worth 1
+        aces: int - number of aces in the hand
+    
+    Returns:
+        int - the best total for the hand
+    
+    Examples:
+        >>> best_total(8, 1)
+        18
+        >>> best_total(15, 1)
+        15
+    """
+    if aces and hard_total <= 11:
+        return hard_total + 10
+    return hard_total
+
+
+def _draw_to_17(shoe: Shoe, hard_total: int, aces: int, hit_soft_17: bool) -> int:
+    """Keep drawing until the hand reaches 17, returning its final total."""
+    while True:
+        total = best_total(hard_total, aces)
+        is_soft = aces and hard_total <= 11
+        if total > 17 or (total == 17 and not (is_soft and hit_soft_17)):
+            return total
+        card = shoe.draw()
+        hard_total += CARD_VALUES[card]
+        aces += card == ACE
+
+
+def play_round(shoe: Shoe, rules: HouseRules, counts: Counter) -> float:
+    """
+    Deal and settle one round between the player and the dealer.
+    
+    Args:
+        shoe: Shoe - where the cards come from
+        rules: HouseRules - the variant being simulated
+        counts: Counter - updated with every rule and outcome that happens
+    
+    Returns:
+        float - the player's net return, in units of the initial bet
+    """
+    player_one, dealer_up, player_two, dealer_hole = shoe.draw(), shoe.draw(), shoe.draw(), shoe.draw()
+    pair = PAIR_TABLE[player_one * 13 + player_two]
+    dealer_pair = PAIR_TABLE[dealer_up * 13 + dealer_hole]
+    
+    if pair.blackjack or dealer_pair.blackjack:
+        counts['blackjack'] += pair.blackjack
+        counts['dealer_blackjack'] += dealer_pair.blackjack
+        if pair.blackjack and dealer_pair.blackjack:
+            counts['push'] += 1
+            return 0.0
+        if pair.blackjack:
+            counts['win'] += 1
+            return rules.blackjack_payout
+        counts['loss'] += 1
+        return -1.0
+    
+    # Each player hand is (final total, bet)
+    if rules.allow_split and pair.split:
+        counts['split'] += 1
+        hands = []
+        for card in (player_one, player_two):
+            second = shoe.draw()
+            hard_total = CARD_VALUES[card] + CARD_VALUES[second]
+            aces = (card == ACE) + (second == ACE)
+            hands.append((_draw_to_17(shoe, hard_total, aces, False), 1))
+    elif rules.allow_double and pair.double_down:
+        counts['double_down'] += 1
+        card = shoe.draw()
+        hard_total = pair.total + CARD_VALUES[card]
+        aces = (player_one == ACE) + (player_two == ACE) + (card == ACE)
+        hands = [(best_total(hard_total, aces), 2)]
+    else:
+        aces = (player_one == ACE) + (player_two == ACE)
+        hands = [(_draw_to_17(shoe, pair.total, aces, False), 1)]
+    
+    dealer_total = 0
+    if any(total <= 21 for total, _ in hands):
+        aces = (dealer_up == ACE) + (dealer_hole == ACE)
+        dealer_total = _draw_to_17(shoe, dealer_pair.total, aces, rules.dealer_hits_soft_17)
+        counts['dealer_bust'] += dealer_total > 21
+    
+    net_return = 0.0
+    for total, bet in hands:
+        if total > 21:
+            counts['player_bust'] += 1
+            counts['loss'] += 1
+            net_return -= bet
+        elif dealer_total > 21 or total > dealer_total:
+            counts['win'] += 1
+            net_return += bet
+        elif total < dealer_total:
+            counts['loss'] += 1
+            net_return -= bet
+        else:
+            counts['push'] += 1
+    
+    return net_return
+
+
+def run_stream(rounds: int, seed: int, stream: int, rules: HouseRules) -> SimulationResult:
+    """
+    Simulate one independent stream of rounds with its own shoe and random generator.
+    
+    Args:
+        rounds: int - how many rounds to deal
+        seed: int - the seed shared by every stream of a simulation
+        stream: int - which stream this is
+        rules: HouseRules - the variant being simulated
+    
+    Returns:
+        SimulationResult - totals for this stream only
+    
+    Notes:
+        Seeding NumPy's generator with [seed, stream] gives every stream its
+        own random sequence, and the same pair always gives the same sequence,
+        so a stream always deals the same cards.
+    """
+    rng = np.random.default_rng([seed, stream])
+    shoe = Shoe(rules.decks, rules.penetration, rng)
+    counts = Counter()
+    total_return = 0.0
+    
+    for _ in range(rounds):
+        if shoe.needs_shuffle():
+            shoe.shuffle()
+        total_return += play_round(shoe, rules, counts)
+    
+    return SimulationResult(rounds, total_return, dict(counts))
+
+
+def _run_stream_args(args):
+    return run_stream(*args)
+
+
+def simulate(rounds: int, seed: int = 0, rules: HouseRules = HouseRules(),
+             streams: int = 8, processes: Optional[int] = None) -> SimulationResult:
+    """
+    Simulate many rounds of blackjack across a pool of processes.
+    
+    Args:
+        rounds: int - total number of rounds to deal
+        seed: int - seed that makes the whole simulation reproducible
+        rules: HouseRules - the variant being simulated
+        streams: int - number of independent streams to split the rounds into
+        processes: int - worker processes to use, None for one per CPU and
+            1 to run everything in the current process
+    
+    Returns:
+        SimulationResult - combined totals, with ev and frequencies properties
+    
+    Purpose:
+        Each stream only depends on (seed, stream number), and results are
+        combined in stream order, so the same seed and number of streams give
+        the same answer no matter how many processes do the work.
+    
+    Notes:
+        Scripts that call this with more than one process need the usual
+        if __name__ == '__main__': guard, because worker processes may
+        re-import the calling module.
+    
+    Examples:
+        >>> first = simulate(2000, seed=42, streams=4, processes=1)
+        >>> second = simulate(2000, seed=42, streams=4, processes=1)
+        >>> first == second
+        True
+        >>> first.rounds
+        2000
+    """
+    if rounds < 0 or streams < 1:
+        raise ValueError('rounds must not be negative and streams must be at least 1')
+    
+    base, extra = divmod(rounds, streams)
+    jobs = [(base + (stream < extra), seed, stream, rules) for stream in range(streams)]
+    
+    if processes == 1:
+        results = [_run_stream_args(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            results = list(pool.map(_run_stream_args, jobs))
+    
+    counts = Counter()
+    total_return = 0.0
+    for result in results:
+        counts.update(result.counts)
+        total_return += result.total_return
+    
+    return SimulationResult(rounds, total_return, dict(counts))
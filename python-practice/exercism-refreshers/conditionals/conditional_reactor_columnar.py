@@ -0,0 +1,170 @@
+"""
+Columnar Reactor Checks for Historical Backfills
+
+Context:
+Backfilling years of sensor history by calling reactor_efficiency and
+fail_safe once per row takes all night. This module runs the same three checks
+on whole columns of readings at once with NumPy, and can read those columns
+straight from memory-mapped binary or .npy files.
+
+This exercise demonstrates:
+1. Rewriting if/elif chains as vectorized np.select calls
+2. Keeping the exact operation order of the scalar functions so results match
+3. Returning compact category codes and turning them into labels on demand
+4. Memory-mapping column files and processing them in chunks
+
+Requires NumPy.
+
+Notes on matching the scalar functions:
+The conditions are checked in the same order and computed with the same
+operations (for example (power / max_power) * 100, not power * 100 / max_power),
+so every threshold boundary falls the same way. Values are converted to
+float64 first; integer inputs whose products go past 2**53 could round
+differently from Python's exact integers. A theoretical_max_power of zero gives
+inf or nan instead of raising ZeroDivisionError.
+"""
+
+import os
+
+import numpy as np
+
+EFFICIENCY_BANDS = np.array(['green', 'orange', 'red', 'black'])
+SAFETY_STATUSES = np.array(['NORMAL', 'LOW', 'DANGER'])
+CHUNK_ROWS = 1 << 22  # About 32 MB per float64 column per chunk
+
+
+def _as_float(column) -> np.ndarray:
+    return np.asarray(column, dtype=np.float64)
+
+
+def is_criticality_balanced_array(temperature, neutrons_emitted) -> np.ndarray:
+    """
+    is_criticality_balanced for whole columns.
+    
+    Returns:
+        np.ndarray - a boolean per row
+    
+    Examples:
+        >>> is_criticality_balanced_array([750, 800], [650, 650]).tolist()
+        [True, False]
+    """
+    temperature = _as_float(temperature)
+    neutrons_emitted = _as_float(neutrons_emitted)
+    return (temperature < 800) & (neutrons_emitted > 500) & (temperature * neutrons_emitted < 500000)
+
+
+def reactor_efficiency_codes(voltage, current, theoretical_max_power) -> np.ndarray:
+    """
+    reactor_efficiency for whole columns, as indexes into EFFICIENCY_BANDS.
+    
+    Returns:
+        np.ndarray - a uint8 per row: 0 green, 1 orange, 2 red, 3 black
+    """
+    with np.errstate(divide='ignore', invalid='ignore'):
+        efficiency = (_as_float(voltage) * _as_float(current) / _as_float(theoretical_max_power)) * 100
+    return np.select([efficiency >= 80, efficiency >= 60, efficiency >= 30], [0, 1, 2], 3).astype(np.uint8)
+
+
+def reactor_efficiency_array(voltage, current, theoretical_max_power) -> np.ndarray:
+    """
+    reactor_efficiency for whole columns.
+    
+    Returns:
+        np.ndarray - 'green', 'orange', 'red' or 'black' per row
+    
+    Examples:
+        >>> reactor_efficiency_array(10, [1000, 700, 400, 200], 10000).tolist()
+        ['green', 'orange', 'red', 'black']
+    """
+    return EFFICIENCY_BANDS[reactor_efficiency_codes(voltage, current, theoretical_max_power)]
+
+
+def fail_safe_codes(temperature, neutrons_produced_per_second, threshold) -> np.ndarray:
+    """
+    fail_safe for whole columns, as indexes into SAFETY_STATUSES.
+    
+    Returns:
+        np.ndarray - a uint8 per row: 0 NORMAL, 1 LOW, 2 DANGER
+    """
+    rate = _as_float(temperature) * _as_float(neutrons_produced_per_second)
+    threshold = _as_float(threshold)
+    upper_threshold = threshold * 1.1
+    lower_threshold = threshold * 0.9
+    normal = (lower_threshold <= rate) & (rate <= upper_threshold)
+    return np.select([normal, rate < lower_threshold], [0, 1], 2).astype(np.uint8)
+
+
+def fail_safe_array(temperature, neutrons_produced_per_second, threshold) -> np.ndarray:
+    """
+    fail_safe for whole columns.
+    
+    Returns:
+        np.ndarray - 'NORMAL', 'LOW' or 'DANGER' per row
+    
+    Examples:
+        >>> fail_safe_array(10, [1000, 700, 1200], 10000).tolist()
+        ['NORMAL', 'LOW', 'DANGER']
+    """
+    return SAFETY_STATUSES[fail_safe_codes(temperature, neutrons_produced_per_second, threshold)]
+
+
+def load_column(path: str, dtype='<f8') -> np.ndarray:
+    """
+    Memory-map one column of readings.
+    
+    Args:
+        path: str - a .npy file, or a raw file of packed values
+        dtype: NumPy dtype of the values in a raw file (ignored for .npy)
+    
+    Returns:
+        np.ndarray - a read-only memory-mapped array; nothing is read until used
+    """
+    if path.endswith('.npy'):
+        return np.load(path, mmap_mode='r')
+    return np.memmap(path, dtype=dtype, mode='r')
+
+
+def backfill(columns: dict, output_dir: str, chunk_rows: int = CHUNK_ROWS) -> dict:
+    """
+    Evaluate all three checks over column files and save the results as .npy files.
+    
+    Args:
+        columns: dict - paths (or arrays) for 'temperature', 'neutrons', 'voltage',
+            'current', 'theoretical_max_power' and 'threshold'
+        output_dir: str - where criticality.npy, efficiency.npy and safety.npy go
+        chunk_rows: int - how many rows to evaluate at a time
+    
+    Returns:
+        dict - the output path for each result
+    
+    Purpose:
+        Inputs and outputs are both memory-mapped and handled a chunk at a
+        time, so histories much bigger than memory can be processed. The
+        efficiency and safety outputs hold the uint8 codes; index
+        EFFICIENCY_BANDS or SAFETY_STATUSES with them to get the labels.
+    """
+    names = ('temperature', 'neutrons', 'voltage', 'current', 'theoretical_max_power', 'threshold')
+    data = {name: load_column(columns[name]) if isinstance(columns[name], str) else columns[name] for name in names}
+    rows = len(data['temperature'])
+    if any(len(column) != rows for column in data.values()):
+        raise ValueError('every column must have the same number of rows')
+    
+    os.makedirs(output_dir, exist_ok=True)
+    paths = {name: os.path.join(output_dir, f'{name}.npy') for name in ('criticality', 'efficiency', 'safety')}
+    outputs = {
+        'criticality': np.lib.format.open_memmap(paths['criticality'], mode='w+', dtype=np.bool_, shape=(rows,)),
+        'efficiency': np.lib.format.open_memmap(paths['efficiency'], mode='w+', dtype=np.uint8, shape=(rows,)),
+        'safety': np.lib.format.open_memmap(paths['safety'], mode='w+', dtype=np.uint8, shape=(rows,)),
+    }
+    
+    for start in range(0, rows, chunk_rows):
+        part = {name: column[start:start + chunk_rows] for name, column in data.items()}
+        end = start + len(part['temperature'])
+        outputs['criticality'][start:end] = is_criticality_balanced_array(part['temperature'], part['neutrons'])
+        outputs['efficiency'][start:end] = reactor_efficiency_codes(
+            part['voltage'], part['current'], part['theoretical_max_power'])
+        outputs['safety'][start:end] = fail_safe_codes(part['temperature'], part['neutrons'], part['threshold'])
+    
+    for output in outputs.values():
+        output.flush()
+    return paths
@@ -0,0 +1,310 @@
+"""
+Reactor Telemetry Monitor
+
+Context:
+is_criticality_balanced, reactor_efficiency and fail_safe each look at one
+reading at a time. A real control room watches a continuous feed of readings
+and only wants to hear about changes: the moment fail_safe goes from 'NORMAL'
+to 'DANGER', or the efficiency band drops from 'green' to 'orange'. This module
+is a long-running monitor that ingests telemetry lines with asyncio, buffers
+them in a fixed-size ring buffer, evaluates the three checks in small batches
+and reports only state transitions, along with how long each alert took.
+
+This exercise demonstrates:
+1. asyncio tasks for reading from a socket or a tailed file
+2. A ring buffer with a fixed size that never grows
+3. Processing readings in micro-batches instead of one at a time
+4. Comparing each new state with the previous one to report transitions
+5. Measuring latency percentiles with the nearest-rank method
+
+Telemetry format:
+One reading per line, six comma-separated numbers:
+    temperature,neutrons_emitted,voltage,current,theoretical_max_power,threshold
+The neutron value is used both as neutrons_emitted for is_criticality_balanced
+and as neutrons_produced_per_second for fail_safe.
+"""
+
+import asyncio
+import math
+import time
+from typing import Callable, NamedTuple, Optional
+
+from conditional_operations_nuclear_reactor import fail_safe, is_criticality_balanced, reactor_efficiency
+
+CHECKS = ('criticality', 'efficiency', 'safety')
+
+
+class Reading(NamedTuple):
+    """One line of telemetry, stamped with the time it was ingested."""
+    temperature: float
+    neutrons: float
+    voltage: float
+    current: float
+    theoretical_max_power: float
+    threshold: float
+    ingested_at: float
+
+
+class Transition(NamedTuple):
+    """A change in one check's result."""
+    check: str
+    previous: object
+    current: object
+    reading: Reading
+    latency: float  # Seconds from ingesting the reading to emitting this transition
+
+
+def parse_reading(line: str, ingested_at: float) -> Reading:
+    """
+    Turn a telemetry line into a Reading.
+    
+    Args:
+        line: str - six comma-separated numbers
+        ingested_at: float - time.perf_counter() value when the line arrived
+    
+    Returns:
+        Reading - the parsed values
+    
+    Raises:
+        ValueError: if the line doesn't hold exactly six numbers, or its
+            theoretical_max_power is 0 (reactor_efficiency would divide by it)
+    
+    Examples:
+        >>> parse_reading('750,650,10,1000,10000,500000', 0.0).temperature
+        750.0
+        >>> parse_reading('750,650,10,1000,0,500000', 0.0)
+        Traceback (most recent call last):
+        ...
+        ValueError: theoretical_max_power must not be 0
+    """
+    fields = line.split(',')
+    if len(fields) != 6:
+        raise ValueError(f'expected 6 comma-separated values, got {len(fields)}')
+    reading = Reading(*map(float, fields), ingested_at)
+    if reading.theoretical_max_power == 0:
+        raise ValueError('theoretical_max_power must not be 0')
+    return reading
+
+
+def evaluate(reading: Reading) -> tuple:
+    """
+    Run all three reactor checks on a reading.
+    
+    Returns:
+        tuple - (is_criticality_balanced, reactor_efficiency, fail_safe) results
+    
+    Examples:
+        >>> evaluate(parse_reading('750,650,10,1000,10000,500000', 0.0))
+        (True, 'green', 'NORMAL')
+    """
+    return (
+        is_criticality_balanced(reading.temperature, reading.neutrons),
+        reactor_efficiency(reading.voltage, reading.current, reading.theoretical_max_power),
+        fail_safe(reading.temperature, reading.neutrons, reading.threshold),
+    )
+
+
+class RingBuffer:
+    """
+    A fixed-size FIFO buffer that overwrites the oldest item when full.
+    
+    The slots are allocated once, so a burst of telemetry can never make the
+    monitor use more memory; it drops the oldest readings and counts them instead.
+    
+    Examples:
+        >>> buffer = RingBuffer(2)
+        >>> for item in 'abc':
+        ...     buffer.push(item)
+        >>> buffer.pop_many(10), buffer.dropped
+        (['b', 'c'], 1)
+    """
+    __slots__ = ('slots', 'start', 'size', 'dropped')
+    
+    def __init__(self, capacity: int):
+        if capacity < 1:
+            raise ValueError('capacity must be at least 1')
+        self.slots = [None] * capacity
+        self.start = 0
+        self.size = 0
+        self.dropped = 0
+    
+    def __len__(self):
+        return self.size
+    
+    def push(self, item):
+        capacity = len(self.slots)
+        if self.size == capacity:
+            self.slots[self.start] = item
+            self.start = (self.start + 1) % capacity
+            self.dropped += 1
+            return
+        self.slots[(self.start + self.size) % capacity] = item
+        self.size += 1
+    
+    def pop_many(self, limit: int) -> list:
+        """Remove and return up to limit items, oldest first."""
+        capacity = len(self.slots)
+        count = min(limit, self.size)
+        items = []
+        for offset in range(count):
+            index = (self.start + offset) % capacity
+            items.append(self.slots[index])
+            self.slots[index] = None
+        self.start = (self.start + count) % capacity
+        self.size -= count
+        return items
+
+
+def percentile(sorted_values: list, percent: float) -> float:
+    """
+    Nearest-rank percentile of values that are already sorted.
+    
+    Examples:
+        >>> percentile([1, 2, 3, 4], 50)
+        2
+        >>> percentile([1, 2, 3, 4], 99)
+        4
+    """
+    rank = max(1, math.ceil(percent / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def print_transition(transition: Transition):
+    """Default transition handler: one line per change."""
+    print(f'{transition.check}: {transition.previous} -> {transition.current} '
+          f'(latency {transition.latency * 1000:.2f} ms)')
+
+
+class ReactorMonitor:
+    """
+    Evaluates telemetry in micro-batches and reports only state transitions.
+    
+    Readings are pushed into a ring buffer by whichever ingestion task is
+    running (see follow_file and serve_socket). The process() task wakes up when
+    readings arrive, takes up to batch_size of them, evaluates the three checks
+    on each and calls on_transition for every check whose result changed. The
+    first reading reports every check with previous=None, so the starting state
+    is known.
+    """
+    
+    def __init__(self, capacity: int = 4096, batch_size: int = 256,
+                 on_transition: Callable[[Transition], None] = print_transition,
+                 latency_samples: int = 10000):
+        self.buffer = RingBuffer(capacity)
+        self.batch_size = batch_size
+        self.on_transition = on_transition
+        self.state = (None, None, None)
+        self.latencies = RingBuffer(latency_samples)
+        self.readings = 0
+        self.malformed = 0
+        self._ready = asyncio.Event()
+    
+    def ingest(self, line: str):
+        """Parse a telemetry line and queue it for evaluation; bad lines are counted and skipped."""
+        line = line.strip()
+        if not line:
+            return
+        try:
+            reading = parse_reading(line, time.perf_counter())
+        except ValueError:
+            self.malformed += 1
+            return
+        self.buffer.push(reading)
+        self._ready.set()
+    
+    def process_batch(self) -> int:
+        """Evaluate up to batch_size buffered readings and return how many were handled."""
+        batch = self.buffer.pop_many(self.batch_size)
+        for reading in batch:
+            new_state = evaluate(reading)
+            if new_state == self.state:
+                continue
+            changed = [index for index in range(len(CHECKS)) if new_state[index] != self.state[index]]
+            latency = time.perf_counter() - reading.ingested_at
+            for index in changed:
+                self.on_transition(Transition(CHECKS[index], self.state[index], new_state[index], reading, latency))
+            self.latencies.push(latency)
+            self.state = new_state
+        self.readings += len(batch)
+        return len(batch)
+    
+    async def process(self):
+        """Run forever, evaluating readings as soon as they arrive."""
+        while True:
+            await self._ready.wait()
+            self._ready.clear()
+            while self.process_batch():
+                await asyncio.sleep(0)  # Let the ingestion tasks run between batches
+    
+    def latency_percentiles(self, percents=(50, 90, 99)) -> dict:
+        """
+        Ingestion-to-alert latency percentiles, in seconds, over recent transitions.
+    
+        Returns:
+            dict - percent -> latency, empty if nothing has been reported yet
+        """
+        capacity = len(self.latencies.slots)
+        samples = sorted(self.latencies.slots[(self.latencies.start + offset) % capacity]
+                         for offset in range(len(self.latencies)))
+        if not samples:
+            return {}
+        return {percent: percentile(samples, percent) for percent in percents}
+    
+    async def follow_file(self, path: str, poll_interval: float = 0.1, from_start: bool = False):
+        """
+        Tail a telemetry file, ingesting every line appended to it.
+    
+        Args:
+            path: str - file that another process appends readings to
+            poll_interval: float - seconds to wait when no new data is available
+            from_start: bool - also ingest the lines already in the file
+    
+        Notes:
+            readline() never blocks, so a backlog or a writer that never
+            pauses would keep this loop busy forever and process() would never
+            run, leaving the ring buffer to overwrite readings. Yielding after
+            every batch_size lines gives process() a turn to drain them.
+        """
+        with open(path, encoding='utf-8') as telemetry:
+            if not from_start:
+                telemetry.seek(0, 2)
+            partial = ''
+            lines_since_yield = 0
+            while True:
+                line = telemetry.readline()
+                if not line:
+                    await asyncio.sleep(poll_interval)
+                    lines_since_yield = 0
+                    continue
+                if not line.endswith('\n'):  # The writer hasn't finished this line yet
+                    partial += line
+                    continue
+                self.ingest(partial + line)
+                partial = ''
+                lines_since_yield += 1
+                if lines_since_yield >= self.batch_size:
+                    await asyncio.sleep(0)
+                    lines_since_yield = 0
+    
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while line := await reader.readline():
+                self.ingest(line.decode('utf-8', errors='replace'))
+        finally:
+            writer.close()
+    
+    async def serve_socket(self, path: Optional[str] = None, host: str = '127.0.0.1', port: int = 0):
+        """
+        Accept telemetry lines from local socket clients.
+    
+        Args:
+            path: str - path for a Unix domain socket, or None to use TCP
+            host: str - TCP address to listen on when no path is given
+            port: int - TCP port, 0 to let the system pick one
+    
+        Returns:
+            asyncio.Server - already serving; close it to stop accepting readings
+        """
+        if path is not None:
+            return await asyncio.start_unix_server(self._handle_connection, path)
+        return await asyncio.start_server(self._handle_connection, host, port)
@@ -0,0 +1,147 @@
+"""
+Generalized Collatz Maps
+
+Context:
+steps() hardcodes n / 2 and 3n + 1, and its while loop trusts that every start
+reaches 1. Variants such as 3n - 1 or 5n + 1 break that: some starts fall into
+cycles that never touch 1, and steps() would loop forever on them. CollatzMap
+takes the rule as parameters and finds the cycle a start ends up in with
+Brent's algorithm, which needs only a couple of values in memory no matter how
+long the path is.
+
+The map is:
+- n // divisor when n is divisible by divisor
+- a * n + b otherwise
+CollatzMap(2, 3, 1) is the original Collatz rule.
+
+This exercise demonstrates:
+1. Turning hardcoded constants into parameters
+2. Brent's cycle detection: finding a cycle without storing visited values
+3. Recovering where the cycle starts once its length is known
+4. Giving up cleanly after a step limit when a sequence keeps growing
+5. Running the same detection over a whole range of starts
+
+Notes:
+Brent's algorithm moves a "hare" forward one step at a time and leaves a
+"tortoise" behind. Each time the distance between them reaches the next power
+of two, the tortoise jumps up to the hare. Once the hare lands on the tortoise,
+the distance walked since the last jump is the cycle length. A second pass,
+with one pointer started that many steps ahead, meets the other at the cycle
+entry.
+"""
+
+from collections import Counter
+from typing import Iterator, NamedTuple, Optional
+
+MAX_STEPS = 100_000
+
+
+class CycleInfo(NamedTuple):
+    """Where a start's sequence ends up."""
+    entry: int           # First value of the sequence that lies on the cycle
+    length: int          # Number of values in the cycle
+    steps_to_entry: int  # Steps from the start to the entry (0 if the start is on the cycle)
+    smallest: int        # Smallest value on the cycle, handy for telling cycles apart
+
+
+class CollatzMap:
+    """
+    A Collatz-style map: n // divisor if divisible, else a * n + b.
+    
+    Examples:
+        >>> CollatzMap().find_cycle(6)
+        CycleInfo(entry=4, length=3, steps_to_entry=6, smallest=1)
+        >>> CollatzMap(2, 3, -1).find_cycle(7)
+        CycleInfo(entry=7, length=5, steps_to_entry=0, smallest=5)
+    """
+    __slots__ = ('divisor', 'a', 'b')
+    
+    def __init__(self, divisor: int = 2, a: int = 3, b: int = 1):
+        if divisor < 2:
+            raise ValueError('divisor must be at least 2')
+        self.divisor = divisor
+        self.a = a
+        self.b = b
+    
+    def __call__(self, number: int) -> int:
+        quotient, remainder = divmod(number, self.divisor)
+        return quotient if remainder == 0 else self.a * number + self.b
+    
+    def __repr__(self):
+        return f'CollatzMap({self.divisor}, {self.a}, {self.b})'
+    
+    def find_cycle(self, start: int, max_steps: int = MAX_STEPS) -> Optional[CycleInfo]:
+        """
+        Find the cycle that start eventually falls into, using Brent's algorithm.
+    
+        Args:
+            start: int - the starting value
+            max_steps: int - give up after this many steps of the search
+    
+        Returns:
+            CycleInfo - the cycle entry, its length, the steps to reach it and
+            its smallest value; None if no cycle showed up within max_steps
+            (the sequence may be growing forever)
+    
+        Notes:
+            Only a handful of integers are kept at any time, so memory
+            doesn't grow with the path length, unlike keeping a set of
+            every value seen.
+    
+        Examples:
+            >>> CollatzMap(2, 5, 1).find_cycle(7, max_steps=1000) is None
+            True
+        """
+        step = self
+        power = length = 1
+        tortoise, hare = start, step(start)
+        walked = 1
+        while tortoise != hare:
+            if walked >= max_steps:
+                return None
+            if power == length:
+                tortoise = hare
+                power *= 2
+                length = 0
+            hare = step(hare)
+            length += 1
+            walked += 1
+    
+        tortoise = hare = start
+        for _ in range(length):
+            hare = step(hare)
+        steps_to_entry = 0
+        while tortoise != hare:
+            tortoise, hare = step(tortoise), step(hare)
+            steps_to_entry += 1
+    
+        smallest, value = tortoise, step(tortoise)
+        while value != tortoise:
+            smallest = min(smallest, value)
+            value = step(value)
+        return CycleInfo(tortoise, length, steps_to_entry, smallest)
+    
+    def find_cycles(self, start: int, stop: int, max_steps: int = MAX_STEPS) -> Iterator[tuple]:
+        """
+        Run find_cycle for every start in range(start, stop).
+    
+        Returns:
+            Iterator of (start, CycleInfo or None) pairs
+        """
+        for number in range(start, stop):
+            yield number, self.find_cycle(number, max_steps)
+    
+    def cycle_census(self, start: int, stop: int, max_steps: int = MAX_STEPS) -> Counter:
+        """
+        Count how many starts in range(start, stop) end in each cycle.
+    
+        Returns:
+            Counter - smallest value of each cycle -> number of starts that end
+            in it; starts with no cycle within max_steps are counted under None
+    
+        Examples:
+            >>> sorted(CollatzMap(2, 3, -1).cycle_census(1, 100).items())
+            [(1, 38), (5, 31), (17, 30)]
+        """
+        return Counter(None if info is None else info.smallest
+                       for _, info in self.find_cycles(start, stop, max_steps))
@@ -0,0 +1,126 @@
+"""
+Persistent Collatz Step Table
+
+Context:
+A service that answers steps(n) for n up to a few billion can't afford to walk
+the whole sequence on every request, and a cache kept in memory starts out
+empty after every restart. This module computes the step count of every number
+up to a limit once and saves them as a .npy file of uint16 values. StepsTable
+memory-maps that file, so a lookup is one array read and every process on the
+machine shares the same pages through the operating system's page cache.
+Numbers past the end of the table are walked forwards until they drop into it.
+
+This exercise demonstrates:
+1. Building a large table in chunks with vectorized NumPy arithmetic
+2. Reusing answers that are already in the table (dynamic programming)
+3. Writing and memory-mapping .npy files with np.lib.format.open_memmap
+4. Replacing a file atomically so readers never see a half-written table
+5. Keeping the same interface and errors as steps()
+
+Requires NumPy.
+
+Notes:
+No number below 2**64 is known to need more than about 2,000 steps, so uint16
+(up to 65,535) has plenty of room and a table for 4 billion numbers takes
+8 GB. Values along the way are kept in uint64. If a start's sequence climbs
+too high to fit, the build stops with OverflowError. Below 2**60 that is not
+known to happen.
+"""
+
+import os
+
+import numpy as np
+
+CHUNK_NUMBERS = 1 << 22  # Numbers handled per vectorized pass
+UINT64_MAX = np.iinfo(np.uint64).max
+
+
+def _fill_chunk(table: np.ndarray, start: int, stop: int):
+    """
+    Fill table[start:stop] assuming every entry below start is already filled.
+    
+    Every number in the chunk is advanced one Collatz step at a time, all at
+    once. As soon as a value drops below start its remaining steps are read
+    from the table, and it leaves the active set.
+    """
+    values = np.arange(start, stop, dtype=np.uint64)
+    counts = np.zeros(len(values), dtype=np.uint16)
+    positions = np.arange(len(values))
+    while len(values):
+        odd = (values & 1).astype(bool)
+        if odd.any() and int(values[odd].max()) > (int(UINT64_MAX) - 1) // 3:
+            raise OverflowError('a Collatz sequence grew past the uint64 range')
+        values = np.where(odd, 3 * values + 1, values >> 1)
+        counts += 1
+        done = values < start
+        table[start + positions[done]] = counts[done] + table[values[done]]
+        keep = ~done
+        values, counts, positions = values[keep], counts[keep], positions[keep]
+
+
+def build_steps_table(limit: int, path: str, chunk_numbers: int = CHUNK_NUMBERS) -> str:
+    """
+    Compute steps(n) for every n below limit and save them as a uint16 .npy file.
+    
+    Args:
+        limit: int - the table covers 1 to limit - 1
+        path: str - where to write the .npy file
+        chunk_numbers: int - how many numbers to advance together
+    
+    Returns:
+        str - the path that was written
+    
+    Purpose:
+        Chunks are filled in increasing order, so every sequence only has
+        to run until it falls below the start of its chunk. The table is
+        written to a temporary file next to path and moved into place when
+        it's complete, so processes that have the old table mapped keep
+        working and new ones see the finished file.
+    """
+    if limit < 2:
+        raise ValueError('limit must be at least 2')
+    temporary_path = f'{path}.partial'
+    table = np.lib.format.open_memmap(temporary_path, mode='w+', dtype=np.uint16, shape=(limit,))
+    table[:2] = 0  # Entry 0 is unused; 1 takes no steps
+    for start in range(2, limit, chunk_numbers):
+        _fill_chunk(table, start, min(start + chunk_numbers, limit))
+    table.flush()
+    del table
+    os.replace(temporary_path, path)
+    return path
+
+
+class StepsTable:
+    """
+    steps() backed by a memory-mapped table from build_steps_table().
+    
+    Examples:
+        >>> import os, tempfile
+        >>> from collatz_conjecture import steps
+        >>> path = build_steps_table(1000, os.path.join(tempfile.mkdtemp(), 'steps.npy'))
+        >>> table = StepsTable(path)
+        >>> table.steps(27), table.steps(12345), steps(12345)
+        (111, 50, 50)
+    """
+    
+    def __init__(self, path: str):
+        self.table = np.load(path, mmap_mode='r')
+        self.limit = len(self.table)
+    
+    def steps(self, number: int) -> int:
+        """
+        Same answer and errors as steps(), read from the table when possible.
+    
+        Numbers at or past the table limit are walked forward with exact
+        integers until they land inside the table.
+        """
+        if number <= 0:
+            raise ValueError("Only positive integers are allowed")
+        step_number = 0
+        while number >= self.limit:
+            number = number // 2 if number % 2 == 0 else number * 3 + 1
+            step_number += 1
+        return step_number + int(self.table[number])
+    
+    def __call__(self, number: int) -> int:
+        return self.steps(number)
@@ -0,0 +1,169 @@
+"""
+Collatz Trajectories
+
+Context:
+steps() walks the whole Collatz sequence and then throws it away, keeping only
+the count. Sometimes the sequence itself is the interesting part: how high it
+climbs, and when. This module produces the sequence lazily, one value at a
+time, summarizes it without storing it, and exports it compactly as packed
+64-bit integers for the many starts where every value fits.
+
+This exercise demonstrates:
+1. Writing a generator function with yield
+2. Using exact integer division (//) so huge values stay exact
+3. Tracking a running maximum without storing the sequence
+4. Packing integers into array('Q') and falling back to Python ints only when needed
+5. A simple binary file format with an escape code for oversized values
+
+File format:
+Each value is one little-endian unsigned 64-bit integer. A value that doesn't
+fit, or that is exactly 2**64 - 1, is written as the escape code 2**64 - 1,
+then its length in bytes as another 64-bit integer, then the value's bytes
+(little-endian), padded with zeros to a multiple of 8.
+"""
+
+import sys
+from array import array
+from typing import BinaryIO, Iterator, NamedTuple
+
+UINT64_LIMIT = 1 << 64
+ESCAPE = UINT64_LIMIT - 1
+BUFFER_VALUES = 1 << 16
+
+
+class TrajectorySummary(NamedTuple):
+    """What steps() counts, plus where the sequence peaked."""
+    steps: int
+    peak: int
+    peak_index: int  # Step at which the peak is first reached (0 is the start)
+
+
+def trajectory(number: int) -> Iterator[int]:
+    """
+    Generate the Collatz sequence from number down to 1, one value at a time.
+    
+    Args:
+        number: int - the starting positive integer
+    
+    Returns:
+        Iterator[int] - the start, every value after it and finally 1
+    
+    Raises:
+        ValueError: If the input is not a positive integer (raised on first use)
+    
+    Notes:
+        Unlike steps(), this uses // instead of /, so values never turn
+        into floats and stay exact however large they get.
+    
+    Examples:
+        >>> list(trajectory(6))
+        [6, 3, 10, 5, 16, 8, 4, 2, 1]
+    """
+    if number <= 0:
+        raise ValueError("Only positive integers are allowed")
+    yield number
+    while number > 1:
+        number = number // 2 if number % 2 == 0 else number * 3 + 1
+        yield number
+
+
+def trajectory_summary(number: int) -> TrajectorySummary:
+    """
+    Count the steps and find the peak without keeping the sequence.
+    
+    Examples:
+        >>> trajectory_summary(27)
+        TrajectorySummary(steps=111, peak=9232, peak_index=77)
+    """
+    peak, peak_index, index = number, 0, 0
+    for index, value in enumerate(trajectory(number)):
+        if value > peak:
+            peak, peak_index = value, index
+    return TrajectorySummary(index, peak, peak_index)
+
+
+def trajectory_array(number: int):
+    """
+    Collect the whole sequence as compactly as possible.
+    
+    Returns:
+        array('Q') with 8 bytes per value when every value fits in 64 bits,
+        otherwise a list of Python ints
+    
+    Examples:
+        >>> trajectory_array(6)
+        array('Q', [6, 3, 10, 5, 16, 8, 4, 2, 1])
+        >>> type(trajectory_array(2 ** 64 + 1)).__name__
+        'list'
+    """
+    packed = array('Q')
+    values = trajectory(number)
+    for value in values:
+        if value >= UINT64_LIMIT:
+            spilled = packed.tolist()
+            spilled.append(value)
+            spilled.extend(values)
+            return spilled
+        packed.append(value)
+    return packed
+
+
+def _flush(buffer: array, stream: BinaryIO):
+    if sys.byteorder == 'big':
+        buffer.byteswap()
+    stream.write(buffer.tobytes())
+    del buffer[:]
+
+
+def write_trajectory(number: int, stream: BinaryIO) -> TrajectorySummary:
+    """
+    Write the sequence to a binary file in the format described above.
+    
+    Args:
+        number: int - the starting positive integer
+        stream: a file opened for writing in binary mode
+    
+    Returns:
+        TrajectorySummary - computed along the way at no extra cost
+    
+    Purpose:
+        Values go through a fixed-size array('Q') buffer, so memory stays
+        the same however long the sequence is.
+    """
+    buffer = array('Q')
+    peak, peak_index, index = number, 0, 0
+    for index, value in enumerate(trajectory(number)):
+        if value > peak:
+            peak, peak_index = value, index
+        if value < ESCAPE:
+            buffer.append(value)
+        else:
+            size = (value.bit_length() + 7) // 8
+            buffer.extend((ESCAPE, size))
+            _flush(buffer, stream)
+            stream.write(value.to_bytes(-(-size // 8) * 8, 'little'))
+        if len(buffer) >= BUFFER_VALUES:
+            _flush(buffer, stream)
+    _flush(buffer, stream)
+    return TrajectorySummary(index, peak, peak_index)
+
+
+def read_trajectory(stream: BinaryIO) -> Iterator[int]:
+    """
+    Read back a sequence written by write_trajectory().
+    
+    Examples:
+        >>> import io
+        >>> stream = io.BytesIO()
+        >>> write_trajectory(2 ** 64 + 1, stream).steps
+        483
+        >>> _ = stream.seek(0)
+        >>> list(read_trajectory(stream)) == list(trajectory(2 ** 64 + 1))
+        True
+    """
+    while word := stream.read(8):
+        value = int.from_bytes(word, 'little')
+        if value == ESCAPE:
+            size = int.from_bytes(stream.read(8), 'little')
+            value = int.from_bytes(stream.read(-(-size // 8) * 8), 'little')
+        yield value
@@ -0,0 +1,147 @@
+"""
+Collatz Inverse Tree
+
+Context:
+steps() runs the Collatz operations forwards, from a number down to 1. Turning
+them around answers the opposite question: which numbers take exactly k steps?
+Every number m can be reached from 2m (by halving), and also from (m - 1) / 3
+when that is a whole odd number (by 3n + 1). Starting at 1 and applying these
+inverse maps level by level grows the Collatz tree, where level k holds every
+number whose step count is exactly k.
+
+This exercise demonstrates:
+1. Inverting a function to search backwards from the answer
+2. Storing each level of a tree as a compact NumPy array instead of node objects
+3. Applying the inverse maps to a whole level at once with array operations
+4. Pruning a backwards search with a bound on how small values can get
+5. Switching to a forward scan when that is cheaper
+6. Cross-checking the results against steps()
+
+Requires NumPy.
+
+Notes:
+The odd inverse (m - 1) / 3 only exists when m leaves a remainder of 4 when
+divided by 6, because then m - 1 is divisible by 3 and the quotient is odd.
+m = 4 is skipped, because its odd predecessor is 1 itself.
+
+Each number appears on exactly one level, so the levels never overlap and need
+no de-duplication. Level k tops out at 2**k, so levels are stored as uint64,
+which limits the tree to depth 63. Depth 60 has about 3.9 million numbers in
+total, roughly 32 MB.
+"""
+
+import numpy as np
+
+MAX_DEPTH = 63  # 2**63 is the largest value on level 63, the last one that fits in uint64
+
+
+def _parents(level: np.ndarray) -> np.ndarray:
+    """All numbers that reach some number in level with one Collatz step."""
+    odd_sources = level[(level % 6 == 4) & (level > 4)]
+    return np.concatenate([level * 2, (odd_sources - 1) // 3])
+
+
+def _forward_scan(k: int, bound: int) -> np.ndarray:
+    """
+    Every n up to bound with exactly k steps, found by running them all forwards.
+    
+    All starts advance one step at a time together. A value that reaches 1
+    early is dropped before it moves on, so the ones sitting at 1 after k
+    steps got there for the first time on step k.
+    """
+    values = np.arange(1, bound + 1, dtype=np.uint64)
+    starts = values.copy()
+    limit = (int(np.iinfo(np.uint64).max) - 1) // 3
+    for _ in range(k):
+        keep = values != 1
+        values, starts = values[keep], starts[keep]
+        odd = (values & 1).astype(bool)
+        if odd.any() and int(values[odd].max()) > limit:
+            raise OverflowError('this search needs numbers larger than uint64 can hold')
+        values = np.where(odd, 3 * values + 1, values >> 1)
+    return np.sort(starts[values == 1])
+
+
+def collatz_tree(depth: int) -> list:
+    """
+    Grow the Collatz tree backwards from 1.
+    
+    Args:
+        depth: int - how many levels below 1 to build (0 to 63)
+    
+    Returns:
+        list - depth + 1 sorted uint64 arrays; entry k holds every number n
+        with steps(n) == k
+    
+    Raises:
+        ValueError: if depth is negative or above 63
+    
+    Examples:
+        >>> [level.tolist() for level in collatz_tree(6)]
+        [[1], [2], [4], [8], [16], [5, 32], [10, 64]]
+        >>> from collatz_conjecture import steps
+        >>> all(steps(int(n)) == 40 for n in collatz_tree(40)[40])
+        True
+    """
+    if not 0 <= depth <= MAX_DEPTH:
+        raise ValueError(f'depth must be between 0 and {MAX_DEPTH}')
+    levels = [np.array([1], dtype=np.uint64)]
+    for _ in range(depth):
+        levels.append(_parents(levels[-1]))
+    return [np.sort(level) for level in levels]
+
+
+def numbers_with_steps(k: int, bound: int) -> np.ndarray:
+    """
+    Every n up to bound that takes exactly k steps to reach 1.
+    
+    Args:
+        k: int - the step count to look for
+        bound: int - the largest n to include
+    
+    Returns:
+        np.ndarray - sorted uint64 array of those numbers
+    
+    Raises:
+        ValueError: if k is negative
+        OverflowError: if the search would need numbers past uint64
+    
+    Purpose:
+        Only the odd inverse makes numbers smaller, and it can't be used twice
+        in a row because (m - 1) / 3 is always odd. So over r more levels a
+        number shrinks by at most 3 for each odd inverse, about half of the
+        steps, and doubles on the rest. A number m with r levels to go can't
+        lead to anything below m * 2**(r // 2) / 3**(r - r // 2) - 1, so
+        anything bigger than that allows is dropped straight away. This keeps
+        the levels small when bound is small.
+    
+    Notes:
+        The bound is loose, so the levels still grow by about 10% per extra
+        step. Once a level holds more numbers than bound, running every start
+        up to bound forwards for k steps is cheaper, so the search switches
+        to that. Either way the work stays within about k * bound.
+    
+    Examples:
+        >>> numbers_with_steps(7, 100).tolist()
+        [3, 20, 21]
+        >>> from collatz_conjecture import steps
+        >>> numbers_with_steps(20, 10000).tolist() == [n for n in range(1, 10001) if steps(n) == 20]
+        True
+        >>> numbers_with_steps(169, 3000).tolist() == [n for n in range(1, 3001) if steps(n) == 169]
+        True
+    """
+    if k < 0:
+        raise ValueError('k must not be negative')
+    limit = np.iinfo(np.uint64).max
+    level = np.array([1], dtype=np.uint64)
+    for remaining in range(k, 0, -1):
+        if level.size > bound:
+            return _forward_scan(k, bound)
+        if level.size and int(level.max()) > limit // 2:
+            raise OverflowError('this search needs numbers larger than uint64 can hold')
+        level = _parents(level)
+        rest = remaining - 1
+        keep_below = (bound + 1) * 3 ** (rest - rest // 2) // 2 ** (rest // 2)
+        if keep_below < limit:
+            level = level[level <= keep_below]
+    return np.sort(level[level <= bound])
@@ -0,0 +1,253 @@
+"""
+Multi-Denomination Bill Dispenser
+
+Context:
+get_number_of_bills and get_leftover_of_bills answer the question for one
+denomination. A cash machine has several cassettes (say 100s, 50s and 20s),
+each holding a limited number of bills, and has to pay out an amount using as
+few bills as possible without asking for bills it doesn't have. This module
+works out that mix.
+
+This exercise demonstrates:
+1. Building a bigger algorithm out of the two single-denomination helpers
+2. Greedy selection, and when it is guaranteed to be the best answer
+3. Memoized dynamic programming for the cases where greedy isn't enough
+4. Caching precomputed tables so each denomination set is analysed only once
+5. Protecting a shared inventory with a lock
+
+Notes:
+Greedy (largest bill first) is optimal for "canonical" sets such as 1, 5, 10,
+20, 50, 100. It isn't for sets like 1, 3, 4 (6 is 3 + 3, not 4 + 1 + 1), and
+for sets without a bill worth the common divisor (20 and 50 can make 60, but
+greedy takes a 50 first and gets stuck). Whether a set is canonical is checked
+once by comparing greedy with the true minimum for every amount up to the sum
+of the two largest bills (the Kozen and Zaks bound).
+
+Cassette limits are the other catch. When the greedy mix fits within every
+cassette it is still the best answer. When a cassette would run out, the
+dispenser falls back to the dynamic programming search instead. That search
+only tries a short window of counts for each bill (see _swap_bounds), so its
+cost depends on the denominations rather than on the size of the amount.
+"""
+
+import threading
+from functools import lru_cache, reduce
+from math import gcd
+from typing import NamedTuple, Optional
+
+from number_operations_currency_exchange import get_leftover_of_bills, get_number_of_bills
+
+
+class DenominationTable(NamedTuple):
+    """Everything about a set of denominations that doesn't depend on the inventory."""
+    denominations: tuple  # Largest first
+    divisor: int          # Greatest common divisor; only multiples of it can be paid
+    canonical: bool       # Greedy always gives the fewest bills
+    spare_values: tuple   # Per denomination: most the smaller bills can add up to in a best mix
+    swap_sizes: tuple     # Per denomination: most bills of it one swap can add
+
+
+def _greedy(amount: int, denominations: tuple) -> tuple:
+    """Bill counts from taking the largest bill first, with no cassette limits."""
+    counts = []
+    for denomination in denominations:
+        counts.append(get_number_of_bills(amount, denomination))
+        amount = get_leftover_of_bills(amount, denomination)
+    return tuple(counts)
+
+
+def _swap_bounds(denominations: tuple) -> tuple:
+    """
+    How far a best mix can stray from using the largest bill as much as possible.
+    
+    For each position, with bill L there and smaller bills d after it:
+    L // g bills of d (g = gcd(L, d)) are worth the same as d // g bills of L,
+    which is fewer bills. So a best mix never holds L // g bills of d while
+    there is room for d // g more bills of L. Either every smaller count stays
+    below L // g, which caps what the smaller bills add up to (the spare
+    value), or the L cassette is within d // g bills of full (the swap size).
+    """
+    spare_values, swap_sizes = [], []
+    for index, largest in enumerate(denominations):
+        smaller = denominations[index + 1:]
+        spare_values.append(sum((largest // gcd(largest, bill) - 1) * bill for bill in smaller))
+        swap_sizes.append(max((bill // gcd(largest, bill) for bill in smaller), default=0))
+    return tuple(spare_values), tuple(swap_sizes)
+
+
+@lru_cache(maxsize=1 << 16)
+def _fewest_bills(table: DenominationTable, index: int, remaining: int, limits: tuple) -> Optional[tuple]:
+    """
+    Bill counts with the fewest bills that pay remaining exactly within the limits.
+    
+    Args:
+        table: DenominationTable - the bills being used
+        index: int - position of the first denomination still to choose
+        remaining: int - the amount left to pay
+        limits: tuple - bills available for denominations[index:]
+    
+    Returns:
+        tuple - one count per denomination from index on, or None if the
+        amount can't be paid
+    
+    Purpose:
+        Trying every count of the current bill makes the search grow with
+        the amount. The bounds from _swap_bounds leave only a short window of
+        counts that a best mix can use, so each level tries a handful of
+        counts whatever the amount. Counts are tried from the most down, and
+        the loop stops as soon as even paying the rest in the next bill
+        couldn't beat the best mix so far. Keying the cache on the remaining
+        limits lets calls with different inventories share sub-results.
+    """
+    denomination = table.denominations[index]
+    most = min(limits[0], get_number_of_bills(remaining, denomination))
+    if index == len(table.denominations) - 1:
+        if get_leftover_of_bills(remaining, denomination) or most < get_number_of_bills(remaining, denomination):
+            return None
+        return (most,)
+    fewest = max(0, min(most - table.swap_sizes[index] + 1,
+                        -(-(remaining - table.spare_values[index]) // denomination)))
+    next_denomination = table.denominations[index + 1]
+    result, result_bills = None, None
+    for count in range(most, fewest - 1, -1):
+        left = remaining - count * denomination
+        if result is not None and count + -(-left // next_denomination) >= result_bills:
+            break  # Fewer of this bill only needs more bills in total from here on
+        rest = _fewest_bills(table, index + 1, left, limits[1:])
+        if rest is not None and (result is None or count + sum(rest) < result_bills):
+            result, result_bills = (count,) + rest, count + sum(rest)
+    return result
+
+
+@lru_cache(maxsize=None)
+def denomination_table(denominations: tuple) -> DenominationTable:
+    """
+    Analyse a set of denominations once and reuse the result.
+    
+    Args:
+        denominations: tuple - bill values, in any order
+    
+    Returns:
+        DenominationTable - the sorted bills, their common divisor, whether
+        greedy is optimal for them and the bounds the exact search uses
+    
+    Examples:
+        >>> denomination_table((5, 10, 20, 50, 100)).canonical
+        True
+        >>> denomination_table((1, 3, 4)).canonical
+        False
+    """
+    ordered = tuple(sorted(set(denominations), reverse=True))
+    if not ordered or ordered[-1] <= 0:
+        raise ValueError('denominations must be positive')
+    table = DenominationTable(ordered, reduce(gcd, ordered), False, *_swap_bounds(ordered))
+    canonical = ordered[-1] == table.divisor
+    if canonical and len(ordered) > 1:
+        for amount in range(table.divisor, ordered[0] + ordered[1], table.divisor):
+            unlimited = tuple(get_number_of_bills(amount, bill) for bill in ordered)
+            if sum(_greedy(amount, ordered)) != sum(_fewest_bills(table, 0, amount, unlimited)):
+                canonical = False
+                break
+    return table._replace(canonical=canonical)
+
+
+@lru_cache(maxsize=65536)
+def _plan(table: DenominationTable, amount: int, limits: tuple) -> Optional[tuple]:
+    if get_leftover_of_bills(amount, table.divisor):
+        return None
+    if table.canonical:
+        counts = _greedy(amount, table.denominations)
+        if all(count <= limit for count, limit in zip(counts, limits)):
+            return counts
+    return _fewest_bills(table, 0, amount, limits)
+
+
+def plan_dispense(amount: int, inventory: dict) -> dict:
+    """
+    Work out the fewest bills that pay an amount, without touching the inventory.
+    
+    Args:
+        amount: int - the amount to pay out
+        inventory: dict - denomination -> number of bills available
+    
+    Returns:
+        dict - denomination -> number of bills to pay out (only those used)
+    
+    Raises:
+        ValueError: if the amount isn't positive, or the bills available
+            can't make it exactly
+    
+    Examples:
+        >>> plan_dispense(170, {100: 5, 50: 5, 20: 5})
+        {100: 1, 50: 1, 20: 1}
+        >>> plan_dispense(60, {50: 5, 20: 5})
+        {20: 3}
+        >>> plan_dispense(30, {25: 1, 10: 3, 1: 5})
+        {10: 3}
+        >>> plan_dispense(-100, {100: 5})
+        Traceback (most recent call last):
+        ...
+        ValueError: amount must be positive
+    """
+    if amount <= 0:
+        raise ValueError('amount must be positive')
+    table = denomination_table(tuple(inventory))
+    # Capping each limit at what the amount could ever use lets different
+    # inventories share cached plans.
+    limits = tuple(min(inventory[denomination], get_number_of_bills(amount, denomination))
+                   for denomination in table.denominations)
+    counts = _plan(table, amount, limits)
+    if counts is None:
+        raise ValueError(f'{amount} cannot be paid with the bills available')
+    return {denomination: count for denomination, count in zip(table.denominations, counts) if count}
+
+
+def dispense(amount: int, inventory: dict) -> dict:
+    """
+    Pay out an amount in the fewest bills and take them out of the inventory.
+    
+    Args:
+        amount: int - the amount to pay out
+        inventory: dict - denomination -> bills available; updated in place
+    
+    Returns:
+        dict - denomination -> number of bills paid out
+    
+    Raises:
+        ValueError: if the amount isn't positive or can't be paid (the
+            inventory is left unchanged)
+    
+    Examples:
+        >>> cassettes = {100: 1, 20: 10}
+        >>> dispense(140, cassettes), cassettes
+        ({100: 1, 20: 2}, {100: 0, 20: 8})
+    """
+    bills = plan_dispense(amount, inventory)
+    for denomination, count in bills.items():
+        inventory[denomination] -= count
+    return bills
+
+
+class Dispenser:
+    """
+    A shared inventory that many threads can dispense from safely.
+    
+    Examples:
+        >>> machine = Dispenser({50: 2, 20: 5})
+        >>> machine.dispense(90)
+        {50: 1, 20: 2}
+        >>> machine.inventory
+        {50: 1, 20: 3}
+    """
+    
+    def __init__(self, inventory: dict):
+        self.inventory = dict(inventory)
+        self._lock = threading.Lock()
+    
+    def dispense(self, amount: int) -> dict:
+        with self._lock:
+            return dispense(amount, self.inventory)
+    
+    def refill(self, denomination: int, count: int):
+        with self._lock:
+            self.inventory[denomination] = self.inventory.get(denomination, 0) + count
@@ -0,0 +1,213 @@
+"""
+Currency Arbitrage Scanner
+
+Context:
+exchangeable_value works out what one exchange costs once the spread is taken:
+budget / (exchange_rate * (1 + spread / 100)). Chain enough exchanges together
+and it can happen that going round a loop of currencies (say USD -> EUR ->
+JPY -> USD) returns more money than it started with. With hundreds of
+currencies there are far too many loops to try one by one. This scanner turns
+the rates into a graph and finds such a loop with the Bellman-Ford algorithm,
+running each round of it over the whole rate matrix with NumPy.
+
+This exercise demonstrates:
+1. Turning products of rates into sums with logarithms
+2. Detecting a profitable loop as a negative cycle in a graph
+3. Vectorizing the Bellman-Ford relaxation step with NumPy
+4. Reusing the previous answer when only a few rates change
+5. Using a tolerance so rounding errors don't look like profit
+
+Requires NumPy.
+
+Rate matrix:
+rates[i, j] is what one unit of currency j costs in currency i, which is the
+exchange_rate the exercise uses when i is the home currency. spreads[i, j] is
+the percentage fee for that exchange. So converting an amount of i to j gives
+amount / (rates[i, j] * (1 + spreads[i, j] / 100)). A rate of 0 or nan means
+the pair can't be traded.
+
+Notes:
+Each exchange gets the weight log(rates[i, j] * (1 + spreads[i, j] / 100)).
+The money left after a loop is exp(-sum of its weights), so the loop makes a
+profit exactly when its weights sum to less than zero.
+
+Bellman-Ford keeps a potential for every currency and keeps lowering it
+whenever some exchange offers a cheaper route. Without a negative cycle, this
+stops within N rounds. With one, the predecessor links (which exchange last
+lowered each potential) eventually close into a profitable loop, and checking
+for that after every round usually finds it long before round N.
+
+Once a scan finds no cycle, every exchange is consistent with the
+potentials. A rate that goes up can't break that, and one that goes down can
+only break the exchanges out of its own currency. So the next scan starts
+from the old potentials and relaxes only the currencies whose rates changed,
+instead of the whole matrix.
+"""
+
+from typing import NamedTuple, Optional
+
+import numpy as np
+
+TOLERANCE = 1e-12  # Improvements smaller than this are treated as rounding error
+
+
+class Arbitrage(NamedTuple):
+    """A profitable loop of exchanges."""
+    cycle: list   # Currencies in trading order, ending where it started
+    gain: float   # Money at the end of the loop per unit at the start (above 1.0)
+
+
+def log_weights(rates, spreads=0.0) -> np.ndarray:
+    """
+    Edge weights for every exchange, with the spread applied as in exchangeable_value.
+    
+    Args:
+        rates: array-like - (N, N) rate matrix (see the module docstring)
+        spreads: array-like or number - percentage spread per pair
+    
+    Returns:
+        np.ndarray - (N, N) weights; pairs that can't be traded, and each
+        currency with itself, get inf
+    
+    Examples:
+        >>> log_weights([[1, 2], [0.5, 1]]).round(4).tolist()
+        [[inf, 0.6931], [-0.6931, inf]]
+    """
+    rates = np.asarray(rates, dtype=np.float64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        weights = np.log(rates * (1 + np.asarray(spreads, dtype=np.float64) / 100))
+    weights[~np.isfinite(weights)] = np.inf
+    np.fill_diagonal(weights, np.inf)
+    return weights
+
+
+class ArbitrageScanner:
+    """
+    Finds profitable loops in a rate matrix and keeps its work between scans.
+    
+    Args:
+        rates: array-like - (N, N) rate matrix
+        spreads: array-like or number - percentage spread per pair
+        currencies: list - optional names to use in the reported cycles
+        tolerance: float - smallest improvement that counts as real
+    
+    Examples:
+        >>> scanner = ArbitrageScanner([[1, 2, 0], [0, 1, 3], [1 / 6, 0, 1]], currencies=['USD', 'EUR', 'JPY'])
+        >>> scanner.scan() is None
+        True
+        >>> scanner.update(2, 0, 1 / 7)
+        >>> result = scanner.scan()
+        >>> result.cycle, round(result.gain, 4)
+        (['USD', 'EUR', 'JPY', 'USD'], 1.1667)
+    """
+    
+    def __init__(self, rates, spreads=0.0, currencies=None, tolerance: float = TOLERANCE):
+        self.rates = np.array(rates, dtype=np.float64)
+        self.spreads = np.array(np.broadcast_to(np.asarray(spreads, dtype=np.float64), self.rates.shape))
+        self.weights = log_weights(self.rates, self.spreads)
+        self.currencies = currencies
+        self.tolerance = tolerance
+        size = len(self.rates)
+        self.potentials = np.zeros(size)
+        self.predecessors = np.full(size, -1)
+        self._changed = np.ones(size, dtype=bool)
+        self._consistent = False  # True once a scan has finished without finding a cycle
+    
+    def update(self, source: int, target: int, rate: float, spread: Optional[float] = None):
+        """Change one rate (and optionally its spread); the next scan only revisits what changed."""
+        self.rates[source, target] = rate
+        if spread is not None:
+            self.spreads[source, target] = spread
+        if source != target:
+            self.weights[source, target] = log_weights([[0, rate], [0, 0]], self.spreads[source, target])[0, 1]
+        self._changed[source] = True
+    
+    def scan(self) -> Optional[Arbitrage]:
+        """
+        Look for a profitable loop.
+    
+        Returns:
+            Arbitrage - one profitable loop, or None if there isn't any
+    
+        Purpose:
+            Each round relaxes every exchange out of the currencies whose
+            potential dropped in the previous round, as one (A, N) array
+            operation. After a clean scan only the changed currencies start
+            out active, so a handful of rate updates costs a handful of rows.
+        """
+        size = len(self.rates)
+        was_incremental = self._consistent
+        if not was_incremental:
+            self.potentials[:] = 0.0
+            self.predecessors[:] = -1
+            self._changed[:] = True
+        active = np.flatnonzero(self._changed)
+        self._changed[:] = False
+        self._consistent = False
+        columns = np.arange(size)
+        
+        for _ in range(size):
+            if not active.size:
+                self._consistent = True
+                return None
+            candidates = self.potentials[active, None] + self.weights[active]
+            best_rows = candidates.argmin(axis=0)
+            best = candidates[best_rows, columns]
+            improved = np.flatnonzero(best < self.potentials - self.tolerance)
+            self.potentials[improved] = best[improved]
+            self.predecessors[improved] = active[best_rows[improved]]
+            active = improved
+            if active.size:
+                arbitrage = self._find_cycle()
+                if arbitrage is not None:
+                    return arbitrage
+        
+        if not active.size:
+            self._consistent = True
+            return None
+        if was_incremental:
+            return self.scan()  # Old predecessor links hid the loop; start from scratch
+        return None  # Unreachable in exact arithmetic; only rounding could keep potentials falling
+    
+    def _find_cycle(self) -> Optional[Arbitrage]:
+        """
+        Look for a profitable loop among the predecessor links.
+        
+        Following a link N times from any currency either runs off the start
+        of a path or ends up inside a loop. Doing that for every currency at
+        once by pointer doubling takes only log2(N) array lookups, which is
+        cheap enough to do after every round, so a loop is usually reported
+        long before N rounds have passed.
+        """
+        size = len(self.rates)
+        links = np.append(self.predecessors, size)  # Index size stands for "no predecessor"
+        links[links < 0] = size
+        steps = 1
+        while steps < size:
+            links = links[links]
+            steps *= 2
+        
+        seen = set()
+        for node in np.unique(links[:size]):
+            if node == size or node in seen:
+                continue
+            loop = [int(node)]
+            previous = int(self.predecessors[node])
+            while previous != node:
+                loop.append(previous)
+                previous = int(self.predecessors[previous])
+            seen.update(loop)
+            arbitrage = self._check_loop([node] + loop[::-1])
+            if arbitrage is not None:
+                return arbitrage
+        return None
+    
+    def _check_loop(self, loop: list) -> Optional[Arbitrage]:
+        """Turn a loop of currency indexes into an Arbitrage if it really makes a profit."""
+        loop = [int(index) for index in loop]
+        sources, targets = loop[:-1], loop[1:]
+        if self.weights[sources, targets].sum() >= 0:
+            return None
+        gain = float(np.prod(1 / (self.rates[sources, targets] * (1 + self.spreads[sources, targets] / 100))))
+        cycle = [self.currencies[index] for index in loop] if self.currencies is not None else loop
+        return Arbitrage(cycle, gain)
@@ -0,0 +1,226 @@
+"""
+Exchange Book for Exact, Batched Currency Conversion
+
+Context:
+The currency exchange functions use floats throughout, so results like
+get_leftover_of_bills(10.1, 10) come out as 0.0999999999999996 rather than
+0.1, and they convert one budget per call. An ExchangeBook holds the rates for
+many currencies and converts whole arrays of budgets at once. By default it
+works in integer minor units (cents) with exact rational rates. A float mode
+reproduces the original functions bit for bit, for callers that have to match
+existing results.
+
+This exercise demonstrates:
+1. Storing money as integer minor units instead of floats
+2. Exact rates with fractions.Fraction, built from the rate's decimal string
+3. Caching the spread-adjusted rate for each (currency, spread) pair
+4. Reusing get_number_of_bills and get_leftover_of_bills on NumPy arrays
+5. Reproducing round() on arrays without calling it once per row
+
+Requires NumPy.
+
+Notes:
+In exact mode a rate like 1.2 becomes Fraction(6, 5), so converting a
+budget is budget * 5 // 6 in integers. Rounding goes half to even, the same
+way round() treats an exact tie. A rate computed as a float, such as
+1 / 1.2345, has a 16-digit decimal string and so a denominator of 10**16.
+Products like that don't fit in int64, so whenever budget times denominator
+could pass the int64 range the division is done with Python ints instead.
+"""
+
+from decimal import Decimal
+from fractions import Fraction
+
+import numpy as np
+
+from number_operations_currency_exchange import get_leftover_of_bills, get_number_of_bills
+
+MINOR_DIGITS = 2  # Cents
+INT64_MAX = int(np.iinfo(np.int64).max)
+
+
+def to_minor_units(amount, digits: int = MINOR_DIGITS) -> int:
+    """
+    Convert an amount such as Decimal('127.50') or '127.5' to integer minor units.
+    
+    Raises:
+        ValueError: if the amount has more decimal places than the minor unit allows
+    
+    Examples:
+        >>> to_minor_units('127.5')
+        12750
+    """
+    scaled = Decimal(str(amount)).scaleb(digits)
+    if scaled != scaled.to_integral_value():
+        raise ValueError(f'{amount} has more than {digits} decimal places')
+    return int(scaled)
+
+
+def from_minor_units(units, digits: int = MINOR_DIGITS) -> Decimal:
+    """
+    Convert integer minor units back to a Decimal amount.
+    
+    Examples:
+        >>> from_minor_units(10625)
+        Decimal('106.25')
+    """
+    return Decimal(int(units)).scaleb(-digits)
+
+
+def round_like_python(values: np.ndarray, digits: int) -> np.ndarray:
+    """
+    Round every value exactly as round(value, digits) would.
+    
+    Purpose:
+        np.round multiplies by 10**digits before rounding, and that
+        multiplication can push a value sitting just next to a tie onto the
+        other side of it. round() works from the exact value of the float
+        instead. Only values within rounding error of a tie can disagree, so
+        those few rows are redone with round() and the rest stay vectorized.
+    
+    Examples:
+        >>> round_like_python(np.array([106.25, 2.675]), 2).tolist()
+        [106.25, 2.67]
+    """
+    values = np.asarray(values, dtype=np.float64)
+    result = np.round(values, digits)
+    scaled = values * 10.0 ** digits
+    distance_from_tie = np.abs(np.abs(scaled - np.floor(scaled)) - 0.5)
+    for index in np.flatnonzero(distance_from_tie <= 1e-12 * np.maximum(1.0, np.abs(scaled))):
+        result.flat[index] = round(float(values.flat[index]), digits)
+    return result
+
+
+class ExchangeBook:
+    """
+    Exchange rates for several currencies, with batch versions of the exercise functions.
+    
+    Args:
+        rates: dict - currency code -> unit value of that currency (like exchange_rate)
+        exact: bool - True to work in integer minor units, False to match the
+            float functions exactly
+        digits: int - decimal places in a minor unit (exact mode only)
+    
+    In exact mode budgets and results are int64 minor units, while
+    denominations are still given in whole units, like the exercise does. In
+    float mode everything is a float64 array in whole units, as in the original
+    functions.
+    
+    Examples:
+        >>> book = ExchangeBook({'EUR': 1.2})
+        >>> book.exchange_money([12750], 'EUR').tolist()
+        [10625]
+        >>> book.exchangeable_value([12725, 12725], 'EUR', 10, [20, 5]).tolist()
+        [8000, 9500]
+        >>> book.get_leftover_of_bills([1010], 10).tolist()
+        [10]
+        >>> floats = ExchangeBook({'EUR': 1.2}, exact=False)
+        >>> floats.exchange_money([127.5], 'EUR').tolist()
+        [106.25]
+        >>> floats.exchangeable_value([127.25], 'EUR', 10, 20).tolist()
+        [80.0]
+    """
+    
+    def __init__(self, rates: dict, exact: bool = True, digits: int = MINOR_DIGITS):
+        self.exact = exact
+        self.digits = digits
+        self.rates = {currency: Fraction(str(rate)) if exact else float(rate) for currency, rate in rates.items()}
+        self._rates_with_spread = {}
+    
+    def set_rate(self, currency: str, rate):
+        """Add or change a rate, dropping any cached spread rates for that currency."""
+        self.rates[currency] = Fraction(str(rate)) if self.exact else float(rate)
+        for key in [key for key in self._rates_with_spread if key[0] == currency]:
+            del self._rates_with_spread[key]
+    
+    def rate_with_spread(self, currency: str, spread=0):
+        """
+        The exchange rate after the spread fee, computed once per (currency, spread).
+    
+        Returns:
+            Fraction in exact mode, float in float mode
+    
+        Examples:
+            >>> ExchangeBook({'EUR': 1.2}).rate_with_spread('EUR', 10)
+            Fraction(33, 25)
+        """
+        key = (currency, spread)
+        rate = self._rates_with_spread.get(key)
+        if rate is None:
+            if self.exact:
+                rate = self.rates[currency] * (1 + Fraction(str(spread)) / 100)
+            else:
+                rate = self.rates[currency] * (1 + spread / 100)  # Same operations as exchangeable_value
+            self._rates_with_spread[key] = rate
+        return rate
+    
+    def _budgets(self, budgets) -> np.ndarray:
+        return np.asarray(budgets, dtype=np.int64 if self.exact else np.float64)
+    
+    def _denominations(self, denominations) -> np.ndarray:
+        if self.exact:
+            return np.asarray(denominations, dtype=np.int64) * 10 ** self.digits
+        return np.asarray(denominations, dtype=np.float64)
+    
+    @staticmethod
+    def _divide(budgets: np.ndarray, rate: Fraction) -> tuple:
+        """
+        Exact quotient and remainder of budgets / rate.
+    
+        Stays in int64 when every intermediate fits, and falls back to Python
+        ints (an object array) when budget * denominator or twice the
+        numerator would overflow.
+        """
+        largest = int(np.abs(budgets).max()) if budgets.size else 0
+        if largest * rate.denominator <= INT64_MAX and 2 * rate.numerator <= INT64_MAX:
+            return np.divmod(budgets * rate.denominator, rate.numerator)
+        scaled = budgets.astype(object) * rate.denominator
+        return scaled // rate.numerator, scaled % rate.numerator
+    
+    def exchange_money(self, budgets, currency: str, spread=0) -> np.ndarray:
+        """
+        exchange_money for a whole array of budgets.
+    
+        Returns:
+            np.ndarray - foreign amounts, rounded to the minor unit (half to even)
+    
+        Examples:
+            >>> ExchangeBook({'X': 1 / 1.2345}).exchange_money([12750, 1], 'X').tolist()
+            [15740, 1]
+        """
+        budgets = self._budgets(budgets)
+        rate = self.rate_with_spread(currency, spread)
+        if not self.exact:
+            return round_like_python(budgets / rate, 2)
+        quotient, remainder = self._divide(budgets, rate)
+        twice = 2 * remainder
+        round_up = (twice > rate.numerator) | ((twice == rate.numerator) & (quotient % 2 == 1))
+        return (quotient + round_up).astype(np.int64)
+    
+    def get_number_of_bills(self, amounts, denominations) -> np.ndarray:
+        """get_number_of_bills for whole arrays (amounts in the book's units)."""
+        return get_number_of_bills(self._budgets(amounts), self._denominations(denominations))
+    
+    def get_leftover_of_bills(self, amounts, denominations) -> np.ndarray:
+        """get_leftover_of_bills for whole arrays (amounts in the book's units)."""
+        return get_leftover_of_bills(self._budgets(amounts), self._denominations(denominations))
+    
+    def exchangeable_value(self, budgets, currency: str, spread, denominations) -> np.ndarray:
+        """
+        exchangeable_value for a whole array of budgets.
+    
+        Returns:
+            np.ndarray - the most foreign currency obtainable in whole bills
+    
+        Examples:
+            >>> ExchangeBook({'X': 1 / 1.2345}).exchangeable_value([12750], 'X', 0, 5).tolist()
+            [15500]
+        """
+        budgets = self._budgets(budgets)
+        rate = self.rate_with_spread(currency, spread)
+        if self.exact:
+            total_foreign_currency = self._divide(budgets, rate)[0].astype(np.int64)
+        else:
+            total_foreign_currency = budgets / rate
+        denominations = self._denominations(denominations)
+        return get_number_of_bills(total_foreign_currency, denominations) * denominations
@@ -11,11 +11,17 @@ This exercise demonstrates:
 2. Using dictionary comprehension to set up letter tracking
 3. Handling non-alphabetic characters in validation
 4. Comparing sets and lists for character uniqueness
+5. Bitmask test-and-set that stops at the first repeated letter
+6. Batch checks over lists of words and wordlist files
 
 The challenge requires determining if a given text is an isogram - a word
 or phrase without a repeating letter, allowing spaces and hyphens.
 """
 
+from typing import Iterable
+
+from character_validation_letter_mask import has_repeated_letter, matching_lines
+
 
 def is_isogram(string: str) -> bool:
     """
@@ -44,7 +50,51 @@ def is_isogram(string: str) -> bool:
         ```
         
         After reading "Dig Deeper" about set operations, learned a more elegant solution
-        by comparing the length of a set (unique letters) with the original list length.
+        by comparing the length of a set (unique letters) with the original list length:
+        ```
+        letters = [char for char in string.lower() if char.isalpha()]
+        return len(set(letters)) == len(letters)
+        ```
+        
+        That version builds a list and a set and keeps going after the first repeat.
+        The letter mask version tests each letter's bit before setting it and
+        returns at the first duplicate.
+        
+    Examples:
+        >>> is_isogram('subdermatoglyphic')
+        True
+        >>> is_isogram('Alphabet')
+        False
+    """
+    return not has_repeated_letter(string.lower())
+
+
+def is_isogram_many(strings: Iterable[str]) -> list[bool]:
+    """
+    Check a whole batch of words or phrases for isograms.
+    
+    Args:
+        strings: Any iterable of strings
+        
+    Returns:
+        A list of booleans, one per string, in the same order
+        
+    Examples:
+        >>> is_isogram_many(['background', 'isograms', 'six-year-old'])
+        [True, False, True]
+    """
+    return list(map(is_isogram, strings))
+
+
+def isograms_in_file(path: str, encoding: str = 'utf-8') -> list[str]:
+    """
+    Scan a wordlist file and collect every line that is an isogram.
+    
+    Args:
+        path: Path to a text file with one word or phrase per line
+        encoding: Text encoding of the file
+        
+    Returns:
+        The isogram lines, without their trailing newlines, in file order
     """
-    letters = [char for char in string.lower() if char.isalpha()]
-    return len(set(letters)) == len(letters)
\ No newline at end of file
+    return list(matching_lines(path, is_isogram, encoding))
\ No newline at end of file
@@ -0,0 +1,104 @@
+"""
+Isogram Search - Finding the longest run of text without a repeated letter
+
+Context:
+is_isogram() checks a whole string at once. Text-analysis jobs also want the
+longest stretch of a (possibly huge) input in which no letter repeats. As with
+is_isogram(), letters are compared without case, and spaces, hyphens and any
+other non-letters may repeat freely.
+
+This exercise demonstrates:
+1. A linear sliding window over the last position of each letter
+2. Moving the left edge of the window forward instead of starting over
+3. Streaming over file chunks while keeping only one position per letter
+4. Sharing the letter tables and chunk reader with the pangram search
+
+Offsets are positions in the original input: character positions for str data
+and byte positions for bytes, binary files and mmaps. In byte data only the
+ASCII letters a-z count as letters.
+"""
+
+from typing import Optional
+
+from character_validation_letter_mask import CHUNK_SIZE, LETTER_INDEXES, iter_chunks
+
+
+def longest_isogram_span(text, chunk_size: int = CHUNK_SIZE) -> tuple[int, int]:
+    """
+    Find the longest stretch of text in which no letter appears twice.
+    
+    Args:
+        text: A str/bytes object, an mmap or memoryview, or an open file
+        chunk_size: How many characters or bytes to read at a time
+    
+    Returns:
+        A (start, end) pair so that text[start:end] is the longest isogram.
+        The earliest span wins when several have the same length, and empty
+        input gives (0, 0).
+    
+    Purpose:
+        Scans the input once. Whenever a letter shows up that was already seen
+        inside the current window, the window's left edge jumps to just after
+        that earlier sighting, so no position is ever looked at twice.
+    
+    Notes:
+        Only the last position of each letter is kept, never the text itself,
+        so memory stays at one entry per letter (26 for English text) even when
+        an open file or mmap is scanned chunk by chunk.
+    
+    Examples:
+        >>> longest_isogram_span('Emily Jung Schwartzkopf')
+        (0, 23)
+        >>> longest_isogram_span('aabcdea')
+        (1, 6)
+        >>> longest_isogram_span(b'abc--abc')
+        (0, 5)
+    """
+    last_seen = {}
+    window_start = 0
+    best = (0, 0)
+    offset = 0
+    
+    for chunk in iter_chunks(text, chunk_size):
+        for position, char in enumerate(chunk, offset):
+            letter = LETTER_INDEXES.get(char)
+            if letter is None and isinstance(char, str) and char.isalpha():
+                letter = char.lower()  # Letters outside a-z count for is_isogram() too
+    
+            if letter is not None:
+                previous = last_seen.get(letter)
+                if previous is not None and previous >= window_start:
+                    window_start = previous + 1
+                last_seen[letter] = position
+    
+            if position + 1 - window_start > best[1] - best[0]:
+                best = (window_start, position + 1)
+        offset += len(chunk)
+    
+    return best
+
+
+def longest_isogram_span_in_file(path: str, encoding: Optional[str] = None,
+                                 chunk_size: int = CHUNK_SIZE) -> tuple[int, int]:
+    """
+    Stream a file from disk and find its longest isogram span.
+    
+    Args:
+        path: Path to the text file
+        encoding: Text encoding to decode with, or None to scan the raw bytes
+        chunk_size: How many characters or bytes to read at a time
+    
+    Returns:
+        A (start, end) pair of byte offsets, or character offsets when an
+        encoding is given
+    
+    Purpose:
+        Reads the file one chunk at a time, so files far bigger than memory
+        can be scanned.
+    """
+    if encoding is None:
+        with open(path, 'rb') as text:
+            return longest_isogram_span(text, chunk_size)
+    
+    with open(path, encoding=encoding, newline='') as text:
+        return longest_isogram_span(text, chunk_size)
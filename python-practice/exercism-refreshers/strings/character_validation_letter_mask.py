@@ -0,0 +1,198 @@
+"""
+Letter Mask Kernel - Tracking the 26 English letters in a single integer
+
+Context:
+Both the pangram detector and the isogram validator answer questions about
+which letters of the alphabet appear in a piece of text. Each letter is given
+one bit of an integer, so "have I seen this letter?" becomes a bitwise AND and
+"remember this letter" becomes a bitwise OR. For the pangram check a set built
+a slice at a time turned out faster, because set() does its loop in C.
+
+This exercise demonstrates:
+1. Representing a set of letters as a 26-bit integer mask
+2. Using bitwise OR to accumulate letters and AND to test for them
+3. Exiting a loop early once the answer is known, one slice at a time
+4. Sharing one helper between several exercises
+5. Reading wordlists and large texts a piece at a time instead of all at once
+
+Bit 0 stands for 'a', bit 1 for 'b', and so on up to bit 25 for 'z'.
+"""
+
+from itertools import repeat
+from typing import Callable, Iterator, Union
+
+ALPHABET = 'abcdefghijklmnopqrstuvwxyz'
+ALL_LETTERS_MASK = (1 << 26) - 1
+LETTER_BITS = {letter: 1 << position for position, letter in enumerate(ALPHABET)}
+LETTER_SET = frozenset(ALPHABET)
+
+# Position of each letter in the alphabet, keyed by upper and lower case characters
+# and by their byte values, so the same lookup works on str, bytes and mmap data.
+LETTER_INDEXES = {
+    key: position
+    for position, letter in enumerate(ALPHABET)
+    for key in (letter, letter.upper(), ord(letter), ord(letter.upper()))
+}
+
+CHUNK_SIZE = 1 << 20  # 1 MiB keeps memory flat no matter how big the input is
+LETTER_SLICE_SIZE = 256  # Characters added to the seen set between checks for all 26 letters
+
+Text = Union[str, bytes, bytearray, memoryview]
+
+
+def characters_seen(text: str) -> set:
+    """
+    Collect the characters of a text, stopping once every letter has appeared.
+    
+    Args:
+        text: A string that has already been lowercased
+    
+    Returns:
+        A set of the characters read, which holds all of LETTER_SET if the
+        text has every letter
+    
+    Purpose:
+        set() runs in C, so adding a whole slice of the text at a time is much
+        faster than handling one character at a time in Python. Checking for
+        all 26 letters after each LETTER_SLICE_SIZE slice still lets a long
+        pangram stop near its start.
+    
+    Examples:
+        >>> sorted(characters_seen('cab'))
+        ['a', 'b', 'c']
+    """
+    seen = set(text[:LETTER_SLICE_SIZE])  # Most sentences fit in this first slice
+    
+    for start in range(LETTER_SLICE_SIZE, len(text), LETTER_SLICE_SIZE):
+        if LETTER_SET <= seen:
+            break
+        seen.update(text[start:start + LETTER_SLICE_SIZE])
+    
+    return seen
+
+
+def letter_mask(text: str) -> int:
+    """
+    Build the mask of lowercase English letters that appear in a text.
+    
+    Args:
+        text: A string that has already been lowercased
+    
+    Returns:
+        An integer with bit n set when the nth letter of the alphabet appears
+    
+    Purpose:
+        Reads the text with characters_seen(), so it stops early once all
+        26 letters have appeared, and only turns the letters it found into
+        bits at the end.
+    
+    Notes:
+        My first version ORed one bit per character in a Python loop. That
+        was several times slower than building a set, because set() does its
+        loop in C.
+    
+    Examples:
+        >>> bin(letter_mask('cab'))
+        '0b111'
+        >>> letter_mask('the quick brown fox jumps over the lazy dog') == ALL_LETTERS_MASK
+        True
+    """
+    seen = characters_seen(text)
+    if LETTER_SET <= seen:
+        return ALL_LETTERS_MASK
+    return sum(map(LETTER_BITS.get, seen, repeat(0)))
+
+
+def has_repeated_letter(text: str) -> bool:
+    """
+    Check whether any letter appears more than once in a text.
+    
+    Args:
+        text: A string that has already been lowercased
+    
+    Returns:
+        True as soon as a repeated letter is found, False otherwise
+    
+    Purpose:
+        Test-and-set over the letter mask: if a letter's bit is already set
+        the letter is a duplicate and the scan stops right there.
+    
+    Notes:
+        isalpha() is also True for letters outside a-z (like 'é'), and the
+        isogram rule has always counted those too. They don't fit in the
+        26-bit mask, so they fall back to a small set.
+    
+    Examples:
+        >>> has_repeated_letter('lumberjacks')
+        False
+        >>> has_repeated_letter('six-year-old')
+        False
+        >>> has_repeated_letter('éclairé')
+        True
+    """
+    mask = 0
+    other_letters = set()
+    
+    for char in text:
+        bit = LETTER_BITS.get(char)
+        if bit is not None:
+            if mask & bit:
+                return True
+            mask |= bit
+        elif char.isalpha():
+            if char in other_letters:
+                return True
+            other_letters.add(char)
+    
+    return False
+
+
+def matching_lines(path: str, predicate: Callable[[str], bool], encoding: str = 'utf-8') -> Iterator[str]:
+    """
+    Yield the lines of a wordlist file that satisfy a check.
+    
+    Args:
+        path: Path to a text file with one word or phrase per line
+        predicate: A function such as is_pangram or is_isogram
+        encoding: Text encoding of the file
+    
+    Returns:
+        An iterator of matching lines with the trailing newline removed
+    
+    Purpose:
+        Reads the file one line at a time so even very large wordlists
+        never have to fit in memory.
+    """
+    with open(path, encoding=encoding) as wordlist:
+        for line in wordlist:
+            line = line.rstrip('\r\n')
+            if predicate(line):
+                yield line
+
+
+def iter_chunks(source, chunk_size: int = CHUNK_SIZE) -> Iterator[Text]:
+    """
+    Split any supported input into chunks that can be scanned in order.
+    
+    Args:
+        source: A str/bytes object, an mmap or memoryview, or an open file
+        chunk_size: How many characters or bytes to read at a time
+    
+    Returns:
+        An iterator of str or bytes chunks covering the whole input
+    
+    Purpose:
+        Lets the searches treat a short string, a file on disk and a mapped
+        file the same way, without ever holding more than one chunk.
+    """
+    if hasattr(source, 'read') and not hasattr(source, '__getitem__'):
+        while True:
+            chunk = source.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+    elif isinstance(source, (str, bytes, bytearray)):
+        yield source
+    else:
+        for start in range(0, len(source), chunk_size):
+            yield source[start:start + chunk_size]
@@ -11,11 +11,17 @@ This exercise demonstrates:
 2. Set operations for efficient character checking
 3. Case insensitivity in string processing
 4. Dictionary comprehension for character tracking
+5. Letter tracking with an early exit, shared with the isogram validator
+6. Batch checks over lists of sentences and wordlist files
 
 The challenge requires determining if a given text is a pangram - a sentence
 that contains every letter of the alphabet at least once, regardless of case.
 """
 
+from typing import Iterable
+
+from character_validation_letter_mask import LETTER_SET, characters_seen, matching_lines
+
 
 def is_pangram(sentence: str) -> bool:
     """
@@ -43,7 +49,50 @@ def is_pangram(sentence: str) -> bool:
         return all(count > 0 for count in letter_counts.values())
         ```
         
-        After learning about sets, discovered a much more elegant solution.
+        After learning about sets, discovered a much more elegant solution:
+        ```
+        return set('abcdefghijklmnopqrstuvwxyz').issubset(set(sentence.lower()))
+        ```
+        
+        That builds two new sets on every call and always reads the whole sentence.
+        characters_seen() builds one set a slice at a time and stops as soon as
+        all 26 letters are in it, so a long pangram is only read near its start.
+        
+    Examples:
+        >>> is_pangram('The quick brown fox jumps over the lazy dog.')
+        True
+        >>> is_pangram('a quick movement of the enemy will jeopardize five gunboats')
+        False
+    """
+    return LETTER_SET <= characters_seen(sentence.lower())
+
+
+def is_pangram_many(sentences: Iterable[str]) -> list[bool]:
+    """
+    Check a whole batch of sentences for pangrams.
+    
+    Args:
+        sentences: Any iterable of strings
+        
+    Returns:
+        A list of booleans, one per sentence, in the same order
+        
+    Examples:
+        >>> is_pangram_many(['Pack my box with five dozen liquor jugs', 'hello'])
+        [True, False]
+    """
+    return list(map(is_pangram, sentences))
+
+
+def pangrams_in_file(path: str, encoding: str = 'utf-8') -> list[str]:
+    """
+    Scan a wordlist file and collect every line that is a pangram.
+    
+    Args:
+        path: Path to a text file with one sentence per line
+        encoding: Text encoding of the file
+        
+    Returns:
+        The pangram lines, without their trailing newlines, in file order
     """
-    # After reading "Dig Deeper" and learning about sets and the issubset method
-    return set('abcdefghijklmnopqrstuvwxyz').issubset(set(sentence.lower()))
\ No newline at end of file
+    return list(matching_lines(path, is_pangram, encoding))
\ No newline at end of file
@@ -0,0 +1,134 @@
+"""
+Pangram Search - Finding where pangrams occur inside large texts
+
+Context:
+is_pangram() only says whether a whole string uses every letter. For large
+corpora we also want to know where: the shortest stretch of text that contains
+all 26 letters, and how far into a stream we have to read before it becomes a
+pangram. The inputs can be several gigabytes, so both searches read the data
+once, in chunks, from strings, open files or memory-mapped files.
+
+This exercise demonstrates:
+1. A linear-time sliding window (two-pointer) search
+2. Tracking the last position of each letter with an OrderedDict
+3. Processing files and mmaps in fixed-size chunks
+4. Reusing the letter mask from the pangram detector as a fast path
+
+Letters are the English letters a-z in either case. Offsets are positions in
+the original input: character positions for str data and byte positions for
+bytes, binary files and mmaps.
+"""
+
+from collections import OrderedDict
+from typing import Optional
+
+from character_validation_letter_mask import ALL_LETTERS_MASK, CHUNK_SIZE, LETTER_INDEXES, iter_chunks
+
+
+def shortest_pangram_window(text, chunk_size: int = CHUNK_SIZE) -> Optional[tuple[int, int]]:
+    """
+    Find the shortest stretch of text that contains every letter of the alphabet.
+    
+    Args:
+        text: A str/bytes object, an mmap or memoryview, or an open file
+        chunk_size: How many characters or bytes to read at a time
+    
+    Returns:
+        A (start, end) pair so that text[start:end] is the shortest pangram,
+        or None if the text never uses all 26 letters. The earliest window
+        wins when several have the same length.
+    
+    Purpose:
+        Scans the input once. The right pointer walks forward over each letter;
+        the left pointer is the oldest "last seen" position among the 26 letters,
+        which is exactly where the shortest window ending here must start.
+    
+    Notes:
+        The classic two-pointer version keeps a count per letter and moves the
+        left pointer forward while its letter's count stays above zero. That
+        needs to look back at text the scan has already passed, which doesn't
+        work across file chunks. Keeping the letters in an OrderedDict sorted by
+        when they were last seen gives the same left pointer in O(1): moving a
+        letter to the end on every sighting leaves the oldest one at the front.
+    
+    Examples:
+        >>> shortest_pangram_window('xx the quick brown fox jumps over the lazy dog xx')
+        (7, 46)
+        >>> shortest_pangram_window(b'abcdefghijklm-nopqrstuvwxyz')
+        (0, 27)
+        >>> shortest_pangram_window('hello world') is None
+        True
+    """
+    last_seen = OrderedDict()
+    best = None
+    offset = 0
+    
+    for chunk in iter_chunks(text, chunk_size):
+        for position, char in enumerate(chunk, offset):
+            letter = LETTER_INDEXES.get(char)
+            if letter is None:
+                continue
+            last_seen[letter] = position
+            last_seen.move_to_end(letter)
+            if len(last_seen) < 26:
+                continue
+            start = next(iter(last_seen.values()))
+            if best is None or position + 1 - start < best[1] - best[0]:
+                best = (start, position + 1)
+        offset += len(chunk)
+    
+    return best
+
+
+def pangram_offset(stream, chunk_size: int = CHUNK_SIZE) -> Optional[int]:
+    """
+    Find how far into a stream the text first becomes a pangram.
+    
+    Args:
+        stream: A str/bytes object, an mmap or memoryview, or an open file
+        chunk_size: How many characters or bytes to read at a time
+    
+    Returns:
+        The smallest offset such that stream[:offset] is a pangram,
+        or None if the stream never uses all 26 letters
+    
+    Purpose:
+        Stops reading as soon as the last missing letter shows up, so a pangram
+        near the start of a huge file costs almost nothing.
+    
+    Notes:
+        Most chunks can't complete the alphabet on their own, so each chunk's
+        letters are first ORed into the mask using set(chunk), which runs at C
+        speed. Only the chunk that fills the mask is walked letter by letter to
+        find the exact offset.
+    
+    Examples:
+        >>> pangram_offset('Pack my box with five dozen liquor jugs. And more text.')
+        39
+        >>> pangram_offset('not even close') is None
+        True
+    """
+    mask = 0
+    offset = 0
+    
+    for chunk in iter_chunks(stream, chunk_size):
+        chunk_mask = 0
+        for char in set(chunk):
+            letter = LETTER_INDEXES.get(char)
+            if letter is not None:
+                chunk_mask |= 1 << letter
+    
+        if mask | chunk_mask != ALL_LETTERS_MASK:
+            mask |= chunk_mask
+            offset += len(chunk)
+            continue
+    
+        for position, char in enumerate(chunk, offset):
+            letter = LETTER_INDEXES.get(char)
+            if letter is None:
+                continue
+            mask |= 1 << letter
+            if mask == ALL_LETTERS_MASK:
+                return position + 1
+    
+    return None
@@ -13,14 +13,21 @@ This exercise demonstrates:
 2. Creating word groups with consistent prefixes
 3. Removing suffixes while handling spelling changes
 4. Converting adjectives to verbs by adding suffixes
+5. Locating a single word lazily instead of splitting the whole sentence
 
 My Learning Process:
 - I initially struggled with initializing variables outside loops and concatenating in the loop
 - I had to look up string slicing syntax for removing characters
 - I learned about the importance of handling punctuation when working with real text
 - I discovered the usefulness of the isalnum() method for detecting non-alphanumeric characters
+- I learned that re.finditer() yields matches one at a time, so I can stop scanning early
 """
 
+import re
+from itertools import islice
+
+WORD_PATTERN = re.compile(r'\S+')  # \S uses the same whitespace rules as str.split()
+
 
 def add_prefix_un(word):
     """
@@ -110,6 +117,58 @@ def remove_suffix_ness(word):
     return no_ness
 
 
+def locate_word(sentence, index):
+    """
+    Find a single word in a sentence without splitting the whole sentence.
+    
+    Args:
+        sentence: str - a sentence to search
+        index: int - the index of the word, as it would be after split()
+        
+    Returns:
+        str - the word at that index, identical to sentence.split()[index]
+        
+    Raises:
+        IndexError: if the sentence has fewer words than the index asks for
+        
+    Purpose:
+        Keeps the cost proportional to the index rather than the sentence length.
+        Positive indexes scan forward only until the requested word is found,
+        and negative indexes scan backward from the end of the sentence.
+        
+    Notes:
+        split() builds a list of every word even when only one is needed. For
+        the forward case I let re.finditer() produce the words lazily and use
+        islice() to skip ahead. There is no reverse finditer(), so the backward
+        case walks the characters from the end with isspace().
+        
+    Examples:
+        >>> locate_word('It got dark as the sun set.', 2)
+        'dark'
+        >>> locate_word('I need to make that bright.', -1)
+        'bright.'
+        >>> locate_word('  spaced   out  ', -2)
+        'spaced'
+    """
+    if index >= 0:
+        match = next(islice(WORD_PATTERN.finditer(sentence), index, None), None)
+        if match is None:
+            raise IndexError('word index out of range')
+        return match.group()
+    
+    position = len(sentence)
+    for _ in range(-index):
+        while position and sentence[position - 1].isspace():
+            position -= 1
+        if not position:
+            raise IndexError('word index out of range')
+        end = position
+        while position and not sentence[position - 1].isspace():
+            position -= 1
+    
+    return sentence[position:end]
+
+
 def adjective_to_verb(sentence, index):
     """
     Extract an adjective from a sentence and convert it to a verb.
@@ -129,6 +188,8 @@ def adjective_to_verb(sentence, index):
         Had to handle punctuation carefully - words at the end of a sentence
         have punctuation that needs to be removed before adding the suffix.
         Learned to use isalnum() to check for non-alphanumeric characters.
+        Originally split the whole sentence just to pick out one word; now
+        uses locate_word() so only the words up to the index are scanned.
         
     Examples:
         >>> adjective_to_verb('I need to make that bright.', -1)
@@ -136,9 +197,7 @@ def adjective_to_verb(sentence, index):
         >>> adjective_to_verb('It got dark as the sun set.', 2)
         'darken'
     """
-    listed_sentence = sentence.split()
-    
-    word = listed_sentence[index]
+    word = locate_word(sentence, index)
     
     if word and not word[-1].isalnum():  # Had to look up isalnum() to identify punctuation
         return word[:-1] + 'en'